@@ -39,7 +39,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         from ..core.graph_manager import GraphManager
 
         try:
-            database = Database(settings.database_url)
+            database = Database(
+                settings.database_url,
+                min_pool_size=settings.db_pool_min,
+                max_pool_size=settings.db_pool_max,
+            )
             await database.connect(run_migrations=settings.db_migrate)
             graph_manager = GraphManager(database, memory_manager.vector_store)
             app.state.database = database
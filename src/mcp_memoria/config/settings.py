@@ -31,6 +31,22 @@ class Settings(BaseSettings):
         default=6333,
         description="Qdrant server port",
     )
+    qdrant_grpc_port: int = Field(
+        default=6334,
+        description="Qdrant server gRPC port",
+    )
+    qdrant_prefer_grpc: bool = Field(
+        default=True,
+        description="Use gRPC instead of REST for Qdrant server data operations",
+    )
+    qdrant_pool_size: int = Field(
+        default=100,
+        description="Qdrant client connection pool size (concurrent in-flight requests)",
+    )
+    qdrant_quantization: Literal["none", "scalar"] = Field(
+        default="none",
+        description="Vector quantization for newly created Qdrant collections",
+    )
 
     # Ollama settings
     ollama_host: str = Field(
@@ -5,11 +5,17 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Any
 
+import numpy as np
+
 from mcp_memoria.storage.qdrant_store import QdrantStore, SearchResult
 from mcp_memoria.utils.datetime_utils import parse_datetime
+from mcp_memoria.utils.similarity import cosine_topk
 
 logger = logging.getLogger(__name__)
 
+# Number of memories scored against the collection per block during consolidation
+SCORING_BLOCK_SIZE = 100
+
 
 @dataclass
 class ConsolidationResult:
@@ -78,48 +84,58 @@ class MemoryConsolidator:
 
         logger.info(f"Processing {len(all_memories)} memories for consolidation")
 
-        # Find similar groups — only consider representative points
-        for memory in all_memories:
-            if memory.id in processed_ids:
-                continue
-
-            if not memory.vector:
-                continue
-
-            # Skip non-representative chunks (only process chunk_index==0 or non-chunked)
-            chunk_index = memory.payload.get("chunk_index", 0)
-            if chunk_index > 0:
-                continue
+        # Only consider representative points (chunk_index==0 or non-chunked)
+        candidates = [
+            m for m in all_memories
+            if m.vector and m.payload.get("chunk_index", 0) == 0
+        ]
+
+        # All vectors are already in memory, so score neighbors locally
+        # (one matrix product per block) instead of a Qdrant search per memory
+        with_vectors = [m for m in all_memories if m.vector]
+        matrix = np.asarray([m.vector for m in with_vectors], dtype=np.float32)
+
+        for batch_start in range(0, len(candidates), SCORING_BLOCK_SIZE):
+            batch = candidates[batch_start:batch_start + SCORING_BLOCK_SIZE]
+            indices, scores = cosine_topk(
+                np.asarray([m.vector for m in batch], dtype=np.float32),
+                matrix,
+                k=max_cluster_size + 1,
+            )
+            batch_similar = [
+                [
+                    SearchResult(with_vectors[j].id, float(score), with_vectors[j].payload)
+                    for j, score in zip(row_indices, row_scores, strict=True)
+                    if score >= similarity_threshold
+                ]
+                for row_indices, row_scores in zip(indices, scores, strict=True)
+            ]
 
-            parent_id = memory.payload.get("parent_id", memory.id)
+            for memory, similar in zip(batch, batch_similar, strict=True):
+                if memory.id in processed_ids:
+                    continue
 
-            # Find similar memories
-            similar = await self.store.search(
-                collection=collection,
-                vector=memory.vector,
-                limit=max_cluster_size + 1,
-                score_threshold=similarity_threshold,
-            )
+                parent_id = memory.payload.get("parent_id", memory.id)
 
-            # Filter out: already processed, self, and chunks from the same parent
-            similar = [
-                s for s in similar
-                if s.id not in processed_ids
-                and s.id != memory.id
-                and s.payload.get("parent_id", s.id) != parent_id
-                and s.payload.get("chunk_index", 0) == 0
-            ]
+                # Filter out: already processed, self, and chunks from the same parent
+                similar = [
+                    s for s in similar
+                    if s.id not in processed_ids
+                    and s.id != memory.id
+                    and s.payload.get("parent_id", s.id) != parent_id
+                    and s.payload.get("chunk_index", 0) == 0
+                ]
 
-            if similar:
-                # Merge similar memories
-                if not dry_run:
-                    await self._merge_memories(collection, memory, similar)
+                if similar:
+                    # Merge similar memories
+                    if not dry_run:
+                        await self._merge_memories(collection, memory, similar)
 
-                merged_count += len(similar)
-                processed_ids.add(memory.id)
-                processed_ids.update(s.id for s in similar)
+                    merged_count += len(similar)
+                    processed_ids.add(memory.id)
+                    processed_ids.update(s.id for s in similar)
 
-                logger.debug(f"Merged {len(similar)} memories into {memory.id}")
+                    logger.debug(f"Merged {len(similar)} memories into {memory.id}")
 
         duration = (datetime.now() - start_time).total_seconds()
 
@@ -386,14 +402,15 @@ class MemoryConsolidator:
                 limit=1000,
                 filter_conditions={"parent_id": parent_id},
             )
-            for sibling in siblings:
-                if sibling.id != memory_id:
-                    await self.store.update_payload(
-                        collection=collection,
-                        id=sibling.id,
-                        payload=boost_payload,
-                        merge=True,
-                    )
+            sibling_updates = [
+                (sibling.id, boost_payload) for sibling in siblings if sibling.id != memory_id
+            ]
+            if sibling_updates:
+                await self.store.update_payload_batch(
+                    collection=collection,
+                    updates=sibling_updates,
+                    merge=True,
+                )
 
         return new_importance
 
@@ -473,17 +490,22 @@ class MemoryConsolidator:
                                 (parent_id, new_importance, current_access + 1)
                             )
 
-                # Update all points
-                for point_id, new_importance, new_access in all_points_to_update:
-                    await self.store.update_payload(
-                        collection=collection,
-                        id=point_id,
-                        payload={
-                            "importance": new_importance,
-                            "access_count": new_access,
-                            "accessed_at": accessed_at,
-                        },
-                        merge=True,
-                    )
+                # Update all points; chunks of one memory share a payload,
+                # so each memory costs a single request
+                await self.store.update_payload_batch(
+                    collection=collection,
+                    updates=[
+                        (
+                            point_id,
+                            {
+                                "importance": new_importance,
+                                "access_count": new_access,
+                                "accessed_at": accessed_at,
+                            },
+                        )
+                        for point_id, new_importance, new_access in all_points_to_update
+                    ],
+                    merge=True,
+                )
 
         return new_importance
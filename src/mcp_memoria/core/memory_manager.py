@@ -1,6 +1,6 @@
 """Central memory manager coordinating all memory operations."""
 
-import asyncio
+import heapq
 import logging
 from datetime import datetime
 from pathlib import Path
@@ -17,6 +17,7 @@ from mcp_memoria.core.memory_types import (
 )
 from mcp_memoria.core.multi_recall import MultiRecall
 from mcp_memoria.core.working_memory import WorkingMemory
+from mcp_memoria.embeddings.batcher import EmbeddingBatcher
 from mcp_memoria.embeddings.chunking import ChunkingConfig, TextChunker
 from mcp_memoria.embeddings.embedding_cache import EmbeddingCache
 from mcp_memoria.embeddings.ollama_client import OllamaEmbedder
@@ -75,7 +76,11 @@ class MemoryManager:
             path=qdrant_path,
             host=self.settings.qdrant_host,
             port=self.settings.qdrant_port,
+            grpc_port=self.settings.qdrant_grpc_port,
+            prefer_grpc=self.settings.qdrant_prefer_grpc,
+            pool_size=self.settings.qdrant_pool_size,
             vector_size=self.settings.embedding_dimensions,
+            quantization=self.settings.qdrant_quantization,
         )
         self.collections = CollectionManager(
             store=self.vector_store,
@@ -95,6 +100,8 @@ class MemoryManager:
             cache=self.cache,
             llm_model=self.settings.llm_model,
         )
+        # Coalesces concurrent single-memory stores into batched embed calls
+        self.embedding_batcher = EmbeddingBatcher(self.embedder)
 
     def _init_working_memory(self) -> None:
         """Initialize working memory."""
@@ -185,12 +192,9 @@ class MemoryManager:
             chunk_count = len(chunks)
             base_payload = memory.to_payload()
 
-            # Embed all chunks in parallel for better performance
-            async def embed_chunk(text: str):
-                return await self.embedder.embed(text, text_type="document")
-
-            embedding_results = await asyncio.gather(
-                *[embed_chunk(chunk.text) for chunk in chunks]
+            # Embed all chunks in a single batched request
+            embedding_results = await self.embedder.embed_batch(
+                [chunk.text for chunk in chunks], text_type="document"
             )
 
             points = []
@@ -214,7 +218,7 @@ class MemoryManager:
             logger.info(f"Stored {memory_type.value} memory {memory.id} in {chunk_count} chunks")
         else:
             # Single-point storage (backward compatible)
-            result = await self.embedder.embed(content, text_type="document")
+            result = await self.embedding_batcher.embed(content, text_type="document")
             payload = memory.to_payload()
             payload["is_chunk"] = False
             payload["parent_id"] = memory.id
@@ -320,20 +324,22 @@ class MemoryManager:
         # Over-fetch to compensate for chunk deduplication
         fetch_limit = limit * 3
 
-        all_results = []
-
-        for memory_type in memory_types:
-            # Search in collection
-            search_results = await self.vector_store.search(
-                collection=memory_type.value,
-                vector=result.embedding,
-                limit=fetch_limit,
-                score_threshold=min_score,
-                filter_conditions=filters,
-            )
-
-            for sr in search_results:
-                all_results.append((sr, memory_type))
+        # Search all collections concurrently, fetching only what
+        # deduplication needs; full payloads (which carry full_content for
+        # every chunk) are loaded below for the final top results only.
+        by_collection = await self.vector_store.search_many_collections(
+            collections=[t.value for t in memory_types],
+            vector=result.embedding,
+            limit=fetch_limit,
+            score_threshold=min_score,
+            filter_conditions=filters,
+            with_payload=["parent_id"],
+        )
+        all_results = [
+            (sr, memory_type)
+            for memory_type in memory_types
+            for sr in by_collection[memory_type.value]
+        ]
 
         # Deduplicate by parent_id: keep the best score per logical memory
         best_by_parent: dict[str, tuple] = {}
@@ -342,29 +348,38 @@ class MemoryManager:
             if parent_id not in best_by_parent or sr.score > best_by_parent[parent_id][0].score:
                 best_by_parent[parent_id] = (sr, memory_type)
 
-        # Build deduplicated results and collect items for batch boost
-        deduped_results = []
-        boost_items: list[tuple[str, str]] = []
+        # Collect items for batch boost
+        boost_items = [(memory_type.value, sr.id) for sr, memory_type in best_by_parent.values()]
+
+        # Top results by score
+        top = heapq.nlargest(limit, best_by_parent.items(), key=lambda x: x[1][0].score)
 
-        for parent_id, (sr, memory_type) in best_by_parent.items():
-            memory = MemoryItem.from_payload(parent_id, sr.payload)
+        # Hydrate full payloads for the surviving results, one get per collection
+        ids_by_collection: dict[str, list[str]] = {}
+        for _, (sr, memory_type) in top:
+            ids_by_collection.setdefault(memory_type.value, []).append(sr.id)
+        payloads: dict[str, dict[str, Any]] = {}
+        for collection, ids in ids_by_collection.items():
+            for point in await self.vector_store.get(collection=collection, ids=ids):
+                payloads[point.id] = point.payload
+
+        deduped_results = []
+        for parent_id, (sr, _) in top:
+            payload = payloads.get(sr.id)
+            if payload is None:
+                # Deleted between search and hydration
+                continue
             deduped_results.append(
                 RecallResult(
-                    memory=memory,
+                    memory=MemoryItem.from_payload(parent_id, payload),
                     score=sr.score,
                 )
             )
-            # Collect for batch boost instead of individual calls
-            boost_items.append((memory_type.value, sr.id))
 
         # Boost importance on access in batch (fixes N+1 query)
         if boost_items:
             await self.consolidator.boost_on_access_batch(boost_items)
 
-        # Sort by score and limit
-        deduped_results.sort(key=lambda x: x.score, reverse=True)
-        deduped_results = deduped_results[:limit]
-
         # Log action
         self.working_memory.add_to_history(
             "recall_memory",
@@ -589,12 +604,9 @@ class MemoryManager:
                 base_payload = updated_memory.to_payload()
                 base_payload["updated_at"] = datetime.now().isoformat()
 
-                # Embed all chunks in parallel
-                async def embed_chunk(text: str):
-                    return await self.embedder.embed(text, text_type="document")
-
-                embedding_results = await asyncio.gather(
-                    *[embed_chunk(chunk.text) for chunk in chunks]
+                # Embed all chunks in a single batched request
+                embedding_results = await self.embedder.embed_batch(
+                    [chunk.text for chunk in chunks], text_type="document"
                 )
 
                 points = []
@@ -639,13 +651,11 @@ class MemoryManager:
                 update_payload.update(metadata)
 
             point_ids = await self._get_memory_point_ids(memory_id, memory_type.value)
-            for pid in point_ids:
-                await self.vector_store.update_payload(
-                    collection=memory_type.value,
-                    id=pid,
-                    payload=update_payload,
-                    merge=True,
-                )
+            await self.vector_store.update_payload_batch(
+                collection=memory_type.value,
+                updates=[(pid, update_payload) for pid in point_ids],
+                merge=True,
+            )
 
         # Invalidate cache
         self.working_memory.invalidate_cache(memory_id)
@@ -700,6 +710,8 @@ class MemoryManager:
                 deleted = await self.vector_store.delete(
                     collection=collection,
                     filter_conditions=filters,
+                    return_count=True,
+                    exact_count=True,
                 )
                 total_deleted += deleted
 
@@ -160,17 +160,18 @@ class MultiRecall:
         """
         result = await self.embedder.embed(query, text_type="query")
 
-        all_results: list[tuple[SearchResult, MemoryType]] = []
-        for memory_type in memory_types:
-            search_results = await self.vector_store.search(
-                collection=memory_type.value,
-                vector=result.embedding,
-                limit=limit,
-                score_threshold=min_score,
-                filter_conditions=filters,
-            )
-            for sr in search_results:
-                all_results.append((sr, memory_type))
+        by_collection = await self.vector_store.search_many_collections(
+            collections=[mt.value for mt in memory_types],
+            vector=result.embedding,
+            limit=limit,
+            score_threshold=min_score,
+            filter_conditions=filters,
+        )
+        all_results: list[tuple[SearchResult, MemoryType]] = [
+            (sr, memory_type)
+            for memory_type in memory_types
+            for sr in by_collection[memory_type.value]
+        ]
 
         # Deduplicate by parent_id
         best_by_parent: dict[str, tuple[SearchResult, MemoryType]] = {}
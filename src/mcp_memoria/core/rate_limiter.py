@@ -1,12 +1,10 @@
 """Rate limiting and circuit breaker for external services."""
 
-import asyncio
 import logging
 import time
-from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Callable, TypeVar
+from typing import Awaitable, Callable, TypeVar
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +19,12 @@ class CircuitState(Enum):
     HALF_OPEN = "half_open"  # Testing if service recovered
 
 
-@dataclass
+# Internal circuit states as plain ints, indexing _STATES for the public enum
+_CLOSED, _OPEN, _HALF_OPEN = range(3)
+_STATES = (CircuitState.CLOSED, CircuitState.OPEN, CircuitState.HALF_OPEN)
+
+
+@dataclass(slots=True, frozen=True)
 class RateLimitConfig:
     """Configuration for rate limiting."""
 
@@ -30,7 +33,7 @@ class RateLimitConfig:
     burst_limit: int = 10  # Maximum burst size
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CircuitBreakerConfig:
     """Configuration for circuit breaker."""
 
@@ -58,77 +61,133 @@ class CircuitOpenError(Exception):
 
 @dataclass
 class RateLimiter:
-    """Token bucket rate limiter with sliding window."""
+    """Token bucket rate limiter.
+
+    The bucket holds up to ``max_requests`` tokens and refills continuously
+    at ``max_requests / window_seconds`` tokens per second, so state is two
+    floats regardless of traffic. Refill-and-take never awaits, so on a
+    single event loop it is atomic without a lock.
+    """
 
     config: RateLimitConfig = field(default_factory=RateLimitConfig)
-    _timestamps: deque = field(default_factory=deque, init=False)
-    _lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False)
+    _tokens: float = field(init=False)
+    _last_refill: float = field(init=False)
 
-    def _cleanup_old_timestamps(self) -> None:
-        """Remove timestamps outside the current window."""
-        cutoff = time.monotonic() - self.config.window_seconds
-        while self._timestamps and self._timestamps[0] < cutoff:
-            self._timestamps.popleft()
+    def __post_init__(self) -> None:
+        self._tokens = float(self.config.max_requests)
+        self._last_refill = time.monotonic()
 
-    async def acquire(self) -> None:
-        """Acquire a rate limit token. Raises RateLimitExceeded if limit reached."""
-        async with self._lock:
-            self._cleanup_old_timestamps()
+    @property
+    def _refill_rate(self) -> float:
+        """Tokens added per second."""
+        return self.config.max_requests / self.config.window_seconds
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(
+            float(self.config.max_requests),
+            self._tokens + (now - self._last_refill) * self._refill_rate,
+        )
+        self._last_refill = now
+
+    def _check_and_consume(self) -> float | None:
+        """Take a token if one is available.
 
-            if len(self._timestamps) >= self.config.max_requests:
-                # Calculate retry time based on oldest request
-                oldest = self._timestamps[0]
-                retry_after = oldest + self.config.window_seconds - time.monotonic()
-                raise RateLimitExceeded(max(0.1, retry_after))
+        Returns:
+            None if a token was taken, otherwise seconds until one refills
+        """
+        self._refill()
+        if self._tokens < 1:
+            # Time until the bucket holds a whole token again; always > 0
+            return (1 - self._tokens) / self._refill_rate
+        self._tokens -= 1
+        return None
 
-            self._timestamps.append(time.monotonic())
+    async def acquire(self) -> None:
+        """Acquire a rate limit token. Raises RateLimitExceeded if limit reached."""
+        retry_after = self._check_and_consume()
+        if retry_after is not None:
+            raise RateLimitExceeded(retry_after)
 
     async def try_acquire(self) -> bool:
         """Try to acquire a token without raising. Returns True if acquired."""
-        try:
-            await self.acquire()
-            return True
-        except RateLimitExceeded:
-            return False
+        return self._check_and_consume() is None
 
     def get_remaining(self) -> int:
         """Get remaining requests in current window."""
-        self._cleanup_old_timestamps()
-        return max(0, self.config.max_requests - len(self._timestamps))
+        self._refill()
+        return int(self._tokens)
 
 
 @dataclass
 class CircuitBreaker:
-    """Circuit breaker for external service calls."""
+    """Circuit breaker for external service calls.
+
+    State changes happen in plain synchronous code between awaits, so on a
+    single event loop they are atomic without a lock: no other coroutine can
+    run while a transition is being made.
+    """
 
     name: str
     config: CircuitBreakerConfig = field(default_factory=CircuitBreakerConfig)
-    _state: CircuitState = field(default=CircuitState.CLOSED, init=False)
+    _state: int = field(default=_CLOSED, init=False)
     _failure_count: int = field(default=0, init=False)
     _success_count: int = field(default=0, init=False)
     _last_failure_time: float = field(default=0.0, init=False)
-    _lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False)
 
     @property
     def state(self) -> CircuitState:
         """Get current circuit state."""
-        return self._state
+        return _STATES[self._state]
 
     @property
     def is_closed(self) -> bool:
         """Check if circuit is closed (normal operation)."""
-        return self._state == CircuitState.CLOSED
-
-    async def _check_recovery(self) -> None:
-        """Check if circuit should transition to half-open."""
-        if self._state == CircuitState.OPEN:
-            time_since_failure = time.monotonic() - self._last_failure_time
-            if time_since_failure >= self.config.recovery_timeout:
-                logger.info(f"Circuit {self.name}: OPEN -> HALF_OPEN (attempting recovery)")
-                self._state = CircuitState.HALF_OPEN
-                self._success_count = 0
-
-    async def call(self, func: Callable[..., T], *args, **kwargs) -> T:
+        return self._state == _CLOSED
+
+    def _check_recovery(self) -> None:
+        """Check if circuit should transition to half-open.
+
+        Raises:
+            CircuitOpenError: If the circuit is open and still cooling down
+        """
+        time_since_failure = time.monotonic() - self._last_failure_time
+        if time_since_failure < self.config.recovery_timeout:
+            raise CircuitOpenError(
+                self.name, max(0.1, self.config.recovery_timeout - time_since_failure)
+            )
+        logger.info(f"Circuit {self.name}: OPEN -> HALF_OPEN (attempting recovery)")
+        self._state = _HALF_OPEN
+        self._success_count = 0
+
+    def _on_half_open_success(self) -> None:
+        """Record a successful trial call, closing the circuit if recovered."""
+        self._success_count += 1
+        if self._success_count >= self.config.success_threshold:
+            logger.info(f"Circuit {self.name}: HALF_OPEN -> CLOSED (recovered)")
+            self._state = _CLOSED
+            self._failure_count = 0
+
+    def _on_failure(self) -> None:
+        """Record a failed call, opening the circuit if needed."""
+        self._failure_count += 1
+        self._last_failure_time = time.monotonic()
+
+        if self._state == _HALF_OPEN:
+            logger.warning(f"Circuit {self.name}: HALF_OPEN -> OPEN (recovery failed)")
+            self._state = _OPEN
+        elif (
+            self._state == _CLOSED
+            and self._failure_count >= self.config.failure_threshold
+        ):
+            logger.warning(
+                f"Circuit {self.name}: CLOSED -> OPEN "
+                f"(failures: {self._failure_count})"
+            )
+            self._state = _OPEN
+
+    async def call(self, func: Callable[..., Awaitable[T]], *args, **kwargs) -> T:
         """Execute function with circuit breaker protection.
 
         Args:
@@ -143,55 +202,25 @@ class CircuitBreaker:
             CircuitOpenError: If circuit is open
             Exception: Original exception from func if circuit allows
         """
-        async with self._lock:
-            await self._check_recovery()
-
-            if self._state == CircuitState.OPEN:
-                retry_after = (
-                    self.config.recovery_timeout
-                    - (time.monotonic() - self._last_failure_time)
-                )
-                raise CircuitOpenError(self.name, max(0.1, retry_after))
+        if self._state == _OPEN:
+            self._check_recovery()
 
         try:
             result = await func(*args, **kwargs)
-
-            async with self._lock:
-                if self._state == CircuitState.HALF_OPEN:
-                    self._success_count += 1
-                    if self._success_count >= self.config.success_threshold:
-                        logger.info(f"Circuit {self.name}: HALF_OPEN -> CLOSED (recovered)")
-                        self._state = CircuitState.CLOSED
-                        self._failure_count = 0
-                elif self._state == CircuitState.CLOSED:
-                    # Reset failure count on success
-                    self._failure_count = 0
-
-            return result
-
-        except Exception as e:
-            async with self._lock:
-                self._failure_count += 1
-                self._last_failure_time = time.monotonic()
-
-                if self._state == CircuitState.HALF_OPEN:
-                    logger.warning(f"Circuit {self.name}: HALF_OPEN -> OPEN (recovery failed)")
-                    self._state = CircuitState.OPEN
-                elif (
-                    self._state == CircuitState.CLOSED
-                    and self._failure_count >= self.config.failure_threshold
-                ):
-                    logger.warning(
-                        f"Circuit {self.name}: CLOSED -> OPEN "
-                        f"(failures: {self._failure_count})"
-                    )
-                    self._state = CircuitState.OPEN
-
+        except Exception:
+            self._on_failure()
             raise
 
+        if self._state == _CLOSED:
+            # Steady state: just reset the failure count
+            self._failure_count = 0
+        elif self._state == _HALF_OPEN:
+            self._on_half_open_success()
+        return result
+
     def reset(self) -> None:
         """Manually reset circuit to closed state."""
-        self._state = CircuitState.CLOSED
+        self._state = _CLOSED
         self._failure_count = 0
         self._success_count = 0
         logger.info(f"Circuit {self.name}: manually reset to CLOSED")
@@ -217,7 +246,7 @@ class ServiceRateLimiter:
         self.rate_limiter = RateLimiter(rate_config or RateLimitConfig())
         self.circuit_breaker = CircuitBreaker(name, circuit_config or CircuitBreakerConfig())
 
-    async def call(self, func: Callable[..., T], *args, **kwargs) -> T:
+    async def call(self, func: Callable[..., Awaitable[T]], *args, **kwargs) -> T:
         """Execute function with rate limiting and circuit breaker.
 
         Args:
@@ -233,8 +262,10 @@ class ServiceRateLimiter:
             CircuitOpenError: If circuit is open
             Exception: Original exception from func
         """
-        # Check rate limit first
-        await self.rate_limiter.acquire()
+        # Check rate limit first, inline rather than through acquire()
+        retry_after = self.rate_limiter._check_and_consume()
+        if retry_after is not None:
+            raise RateLimitExceeded(retry_after)
 
         # Then check circuit breaker
         return await self.circuit_breaker.call(func, *args, **kwargs)
@@ -419,4 +419,8 @@ def create_database_from_settings() -> Database | None:
     if not settings.database_url:
         return None
 
-    return Database(settings.database_url)
+    return Database(
+        settings.database_url,
+        min_pool_size=settings.db_pool_min,
+        max_pool_size=settings.db_pool_max,
+    )
@@ -0,0 +1,9 @@
+-- Migration: Partial index for open (active/paused) work sessions
+-- status/stop/pause/resume all list open sessions oldest first
+-- (WHERE status IN ('active', 'paused') ORDER BY start_time); this index
+-- answers that from the handful of open rows instead of filtering and
+-- sorting the full session history.
+
+CREATE INDEX IF NOT EXISTS idx_sessions_open_start
+ON work_sessions (start_time)
+WHERE status IN ('active', 'paused');
@@ -6,8 +6,10 @@ Each repository handles CRUD operations for a specific domain entity.
 
 from __future__ import annotations
 
+import builtins
 import json
 import logging
+from collections.abc import Iterable
 from datetime import datetime
 from typing import Any
 from uuid import UUID
@@ -63,6 +65,20 @@ class ClientRepository:
             raise RecordNotFoundError("clients", str(client_id))
         return Client(**dict(row))
 
+    async def get_many(self, client_ids: Iterable[UUID]) -> dict[UUID, Client]:
+        """Get several clients by ID in one query.
+
+        Unknown IDs are left out of the result.
+        """
+        ids = list(set(client_ids))
+        if not ids:
+            return {}
+        rows = await self._db.fetch(
+            "SELECT * FROM clients WHERE id = ANY($1::uuid[])",
+            ids,
+        )
+        return {row["id"]: Client(**dict(row)) for row in rows}
+
     async def get_by_name(self, name: str) -> Client | None:
         """Get client by name."""
         row = await self._db.fetchrow(
@@ -71,6 +87,38 @@ class ClientRepository:
         )
         return Client(**dict(row)) if row else None
 
+    async def get_or_create_by_name(self, name: str) -> tuple[UUID, bool]:
+        """Get a client's ID by name, creating the client if needed.
+
+        Lookup and insert happen in a single statement (one round trip).
+
+        Returns:
+            Tuple of (client_id, created)
+        """
+        row = await self._db.fetchrow(
+            """
+            WITH ins AS (
+                INSERT INTO clients (name)
+                VALUES ($1)
+                ON CONFLICT (name) DO NOTHING
+                RETURNING id
+            )
+            SELECT id, TRUE AS created FROM ins
+            UNION ALL
+            SELECT id, FALSE AS created FROM clients WHERE name = $1
+            LIMIT 1
+            """,
+            name,
+        )
+        if row is None:
+            # Inserted concurrently by another transaction after this
+            # statement's snapshot; it is visible to a new statement
+            client = await self.get_by_name(name)
+            if client is None:
+                raise QueryError("Client upsert returned no row")
+            return client.id, False
+        return row["id"], row["created"]
+
     async def list(
         self,
         limit: int = 100,
@@ -158,6 +206,20 @@ class ProjectRepository:
             raise RecordNotFoundError("projects", str(project_id))
         return Project(**dict(row))
 
+    async def get_many(self, project_ids: Iterable[UUID]) -> dict[UUID, Project]:
+        """Get several projects by ID in one query.
+
+        Unknown IDs are left out of the result.
+        """
+        ids = list(set(project_ids))
+        if not ids:
+            return {}
+        rows = await self._db.fetch(
+            "SELECT * FROM projects WHERE id = ANY($1::uuid[])",
+            ids,
+        )
+        return {row["id"]: Project(**dict(row)) for row in rows}
+
     async def get_by_repo(self, repo: str) -> Project | None:
         """Get project by repository path."""
         row = await self._db.fetchrow(
@@ -174,6 +236,44 @@ class ProjectRepository:
         )
         return Project(**dict(row)) if row else None
 
+    async def get_or_create_by_name(
+        self,
+        name: str,
+        client_id: UUID | None = None,
+    ) -> tuple[UUID, bool]:
+        """Get a project's ID by name, creating it under client_id if needed.
+
+        Like get_by_name, any existing project with this name is reused.
+        Lookup and insert happen in a single statement (one round trip).
+
+        Returns:
+            Tuple of (project_id, created)
+        """
+        row = await self._db.fetchrow(
+            """
+            WITH existing AS (
+                SELECT id FROM projects WHERE name = $1 LIMIT 1
+            ), ins AS (
+                INSERT INTO projects (name, client_id)
+                SELECT $1::text, $2::uuid
+                WHERE NOT EXISTS (SELECT 1 FROM existing)
+                RETURNING id
+            )
+            SELECT id, FALSE AS created FROM existing
+            UNION ALL
+            SELECT id, TRUE AS created FROM ins
+            """,
+            name,
+            client_id,
+        )
+        if row is None:
+            # Same fallback as ClientRepository.get_or_create_by_name
+            project = await self.get_by_name(name)
+            if project is None:
+                raise QueryError("Project upsert returned no row")
+            return project.id, False
+        return row["id"], row["created"]
+
     async def list_by_client(
         self,
         client_id: UUID,
@@ -233,6 +333,13 @@ class ProjectRepository:
 class WorkSessionRepository:
     """Repository for WorkSession operations."""
 
+    # Column expressions aggregate() may group by (never user-supplied SQL)
+    _GROUP_BY_COLUMNS = {
+        "client": "client_id::text",
+        "project": "project_id::text",
+        "category": "category::text",
+    }
+
     def __init__(self, db: Database):
         self._db = db
 
@@ -294,6 +401,31 @@ class WorkSessionRepository:
         )
         return [self._row_to_session(row) for row in rows]
 
+    async def get_all_active_with_names(
+        self,
+    ) -> list[tuple[WorkSession, str | None, str | None]]:
+        """Get active/paused sessions with client and project names, oldest first.
+
+        Names are joined in the same query, so no per-session lookups are needed.
+
+        Returns:
+            List of (session, client_name, project_name) tuples
+        """
+        rows = await self._db.fetch(
+            """
+            SELECT s.*, c.name AS client_name, p.name AS project_name
+            FROM work_sessions s
+            LEFT JOIN clients c ON c.id = s.client_id
+            LEFT JOIN projects p ON p.id = s.project_id
+            WHERE s.status IN ('active', 'paused')
+            ORDER BY s.start_time ASC
+            """
+        )
+        return [
+            (self._row_to_session(row), row["client_name"], row["project_name"])
+            for row in rows
+        ]
+
     async def count_active(self) -> int:
         """Count sessions currently active or paused."""
         row = await self._db.fetchrow(
@@ -313,53 +445,176 @@ class WorkSessionRepository:
         offset: int = 0,
     ) -> list[WorkSession]:
         """List sessions with optional filters."""
+        where_clause, params = self._filter_clause(
+            client_id=client_id,
+            project_id=project_id,
+            status=status,
+            category=category,
+            start_after=start_after,
+            start_before=start_before,
+        )
+        param_idx = len(params) + 1
+        params.extend([limit, offset])
+
+        rows = await self._db.fetch(
+            f"""
+            SELECT * FROM work_sessions
+            WHERE {where_clause}
+            ORDER BY start_time DESC
+            LIMIT ${param_idx} OFFSET ${param_idx + 1}
+            """,
+            *params,
+        )
+        return [self._row_to_session(row) for row in rows]
+
+    async def list_recent_with_names(
+        self,
+        limit: int = 10,
+        client_id: UUID | None = None,
+        project_id: UUID | None = None,
+        status: SessionStatus | None = None,
+        category: SessionCategory | None = None,
+        start_after: datetime | None = None,
+        start_before: datetime | None = None,
+    ) -> builtins.list[tuple[WorkSession, str | None, str | None]]:
+        """List the newest matching sessions with client and project names.
+
+        Names are joined in the same query, so no per-session lookups are needed.
+
+        Returns:
+            List of (session, client_name, project_name) tuples, newest first
+        """
+        where_clause, params = self._filter_clause(
+            client_id=client_id,
+            project_id=project_id,
+            status=status,
+            category=category,
+            start_after=start_after,
+            start_before=start_before,
+            table="s.",
+        )
+        params.append(limit)
+
+        rows = await self._db.fetch(
+            f"""
+            SELECT s.*, c.name AS client_name, p.name AS project_name
+            FROM work_sessions s
+            LEFT JOIN clients c ON c.id = s.client_id
+            LEFT JOIN projects p ON p.id = s.project_id
+            WHERE {where_clause}
+            ORDER BY s.start_time DESC
+            LIMIT ${len(params)}
+            """,
+            *params,
+        )
+        return [
+            (self._row_to_session(row), row["client_name"], row["project_name"])
+            for row in rows
+        ]
+
+    async def aggregate(
+        self,
+        group_by: str | None = None,
+        client_id: UUID | None = None,
+        project_id: UUID | None = None,
+        status: SessionStatus | None = None,
+        category: SessionCategory | None = None,
+        start_after: datetime | None = None,
+        start_before: datetime | None = None,
+    ) -> builtins.list[tuple[str | None, int, int]]:
+        """Sum session durations in the database, optionally grouped.
+
+        Args:
+            group_by: "client", "project" or "category"; None (or any other
+                value) returns a single ungrouped row
+            client_id: Filter by client
+            project_id: Filter by project
+            status: Filter by status
+            category: Filter by category
+            start_after: Sessions starting at or after this time
+            start_before: Sessions starting at or before this time
+
+        Returns:
+            List of (group_key, total_minutes, session_count) tuples. The key
+            is the client/project ID or category as text, or None for
+            sessions without one (and for ungrouped totals).
+        """
+        where_clause, params = self._filter_clause(
+            client_id=client_id,
+            project_id=project_id,
+            status=status,
+            category=category,
+            start_after=start_after,
+            start_before=start_before,
+        )
+        group_expr = self._GROUP_BY_COLUMNS.get(group_by or "", "NULL::text")
+
+        rows = await self._db.fetch(
+            f"""
+            SELECT {group_expr} AS group_key,
+                   COALESCE(SUM(duration_minutes), 0)::INT AS total_minutes,
+                   COUNT(*)::INT AS session_count
+            FROM work_sessions
+            WHERE {where_clause}
+            GROUP BY 1
+            """,
+            *params,
+        )
+        return [
+            (row["group_key"], row["total_minutes"], row["session_count"])
+            for row in rows
+        ]
+
+    def _filter_clause(
+        self,
+        client_id: UUID | None = None,
+        project_id: UUID | None = None,
+        status: SessionStatus | None = None,
+        category: SessionCategory | None = None,
+        start_after: datetime | None = None,
+        start_before: datetime | None = None,
+        table: str = "",
+    ) -> tuple[str, builtins.list[Any]]:
+        """Build a WHERE clause and its parameters from session filters.
+
+        `table` qualifies the columns (e.g. "s.") when work_sessions is joined.
+        """
         conditions = []
         params: list[Any] = []
         param_idx = 1
 
         if client_id:
-            conditions.append(f"client_id = ${param_idx}")
+            conditions.append(f"{table}client_id = ${param_idx}")
             params.append(client_id)
             param_idx += 1
 
         if project_id:
-            conditions.append(f"project_id = ${param_idx}")
+            conditions.append(f"{table}project_id = ${param_idx}")
             params.append(project_id)
             param_idx += 1
 
         if status:
-            conditions.append(f"status = ${param_idx}")
+            conditions.append(f"{table}status = ${param_idx}")
             params.append(status.value)
             param_idx += 1
 
         if category:
-            conditions.append(f"category = ${param_idx}")
+            conditions.append(f"{table}category = ${param_idx}")
             params.append(category.value)
             param_idx += 1
 
         if start_after:
-            conditions.append(f"start_time >= ${param_idx}")
+            conditions.append(f"{table}start_time >= ${param_idx}")
             params.append(start_after)
             param_idx += 1
 
         if start_before:
-            conditions.append(f"start_time <= ${param_idx}")
+            conditions.append(f"{table}start_time <= ${param_idx}")
             params.append(start_before)
             param_idx += 1
 
         where_clause = " AND ".join(conditions) if conditions else "TRUE"
-        params.extend([limit, offset])
-
-        rows = await self._db.fetch(
-            f"""
-            SELECT * FROM work_sessions
-            WHERE {where_clause}
-            ORDER BY start_time DESC
-            LIMIT ${param_idx} OFFSET ${param_idx + 1}
-            """,
-            *params,
-        )
-        return [self._row_to_session(row) for row in rows]
+        return where_clause, params
 
     async def pause(self, session_id: UUID, reason: str | None = None) -> WorkSession:
         """Pause an active session."""
@@ -491,6 +746,9 @@ class WorkSessionRepository:
     def _row_to_session(self, row: Any) -> WorkSession:
         """Convert database row to WorkSession model."""
         data = dict(row)
+        # Drop columns joined in from other tables
+        data.pop("client_name", None)
+        data.pop("project_name", None)
         # Parse JSONB pauses
         if isinstance(data.get("pauses"), str):
             data["pauses"] = json.loads(data["pauses"])
@@ -1,11 +1,13 @@
 """Embedding generation module."""
 
 from mcp_memoria.embeddings.ollama_client import OllamaEmbedder
+from mcp_memoria.embeddings.batcher import EmbeddingBatcher
 from mcp_memoria.embeddings.embedding_cache import EmbeddingCache
 from mcp_memoria.embeddings.chunking import TextChunker, TextChunk
 
 __all__ = [
     "OllamaEmbedder",
+    "EmbeddingBatcher",
     "EmbeddingCache",
     "TextChunker",
     "TextChunk",
@@ -0,0 +1,124 @@
+"""Coalescing of concurrent embedding requests into batched calls."""
+
+import asyncio
+import logging
+
+from mcp_memoria.embeddings.ollama_client import EmbeddingResult, OllamaEmbedder
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingBatcher:
+    """Collects embedding requests over a short window and embeds them together.
+
+    Works like a DataLoader: callers await ``embed()`` for a single text,
+    requests arriving within ``window`` seconds (or until ``max_batch_size``
+    is reached) are sent to the embedder as one ``embed_batch`` call, and
+    each caller receives its own result.
+
+    A request that arrives while the batcher is idle (nothing pending and
+    no embedding call in flight) has nothing to coalesce with, so it is sent
+    straight to ``embedder.embed`` instead of waiting out the window.
+    Requests that arrive while that call runs are queued and batched as
+    usual, so a lone ``store()`` pays no extra latency while bursts still
+    share calls.
+    """
+
+    def __init__(
+        self,
+        embedder: OllamaEmbedder,
+        max_batch_size: int = 64,
+        window: float = 0.05,
+    ):
+        """Initialize the batcher.
+
+        Args:
+            embedder: Embedder used for the batched calls
+            max_batch_size: Flush as soon as this many requests are pending
+            window: Seconds to wait for more requests after the first one
+        """
+        self.embedder = embedder
+        self.max_batch_size = max_batch_size
+        self.window = window
+
+        self._pending: list[tuple[str, str, asyncio.Future[EmbeddingResult]]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        # Keep references to in-flight batches so they aren't garbage collected
+        self._tasks: set[asyncio.Task[None]] = set()
+        # Number of single-text embed calls currently running
+        self._direct_in_flight = 0
+
+    async def embed(self, text: str, text_type: str = "document") -> EmbeddingResult:
+        """Embed a single text as part of the next batch.
+
+        Args:
+            text: Text to embed
+            text_type: Either 'query' or 'document'
+
+        Returns:
+            EmbeddingResult for this text
+
+        Raises:
+            RuntimeError: If the embedding call fails
+        """
+        if not self._pending and not self._tasks and not self._direct_in_flight:
+            self._direct_in_flight += 1
+            try:
+                return await self.embedder.embed(text, text_type=text_type)
+            finally:
+                self._direct_in_flight -= 1
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[EmbeddingResult] = loop.create_future()
+        self._pending.append((text, text_type, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        """Dispatch all pending requests, one embed_batch call per text type."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        pending, self._pending = self._pending, []
+        by_type: dict[str, list[tuple[str, asyncio.Future[EmbeddingResult]]]] = {}
+        for text, text_type, future in pending:
+            by_type.setdefault(text_type, []).append((text, future))
+
+        for text_type, items in by_type.items():
+            task = asyncio.create_task(self._run_batch(text_type, items))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(
+        self,
+        text_type: str,
+        items: list[tuple[str, asyncio.Future[EmbeddingResult]]],
+    ) -> None:
+        """Embed one batch and resolve its callers' futures.
+
+        Args:
+            text_type: Text type shared by the batch
+            items: (text, future) pairs
+        """
+        try:
+            results = await self.embedder.embed_batch(
+                [text for text, _ in items], text_type=text_type
+            )
+            # Raises ValueError if the embedder returned the wrong number of results
+            resolved = list(zip(items, results, strict=True))
+        except Exception as e:
+            for _, future in items:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        logger.debug("Embedded batch of %d %s texts", len(items), text_type)
+        for (_, future), result in resolved:
+            if not future.done():
+                future.set_result(result)
@@ -6,6 +6,10 @@ from typing import Iterator
 
 from pydantic import BaseModel
 
+# Whitespace normalization patterns, compiled once
+_MULTI_SPACE_RE = re.compile(r" {2,}")
+_MULTI_NEWLINE_RE = re.compile(r"\n{3,}")
+
 
 @dataclass
 class TextChunk:
@@ -54,17 +58,28 @@ class TextChunker:
         Returns:
             List of TextChunk objects
         """
+        return list(self.iter_chunks(text, metadata))
+
+    def iter_chunks(self, text: str, metadata: dict | None = None) -> Iterator[TextChunk]:
+        """Split text into chunks lazily.
+
+        Chunks are produced one at a time, so a consumer can start working
+        on the first chunk before the rest of the text has been split.
+
+        Args:
+            text: Text to split
+            metadata: Optional metadata to attach to all chunks
+
+        Yields:
+            TextChunk objects, with chunk_index assigned in order
+        """
         if not text or not text.strip():
-            return []
+            return
 
         text = self._normalize_whitespace(text)
-        chunks = list(self._recursive_chunk(text, metadata or {}))
-
-        # Assign chunk indices
-        for i, chunk in enumerate(chunks):
+        for i, chunk in enumerate(self._recursive_chunk(text, metadata or {})):
             chunk.chunk_index = i
-
-        return chunks
+            yield chunk
 
     def _normalize_whitespace(self, text: str) -> str:
         """Normalize whitespace in text.
@@ -76,9 +91,9 @@ class TextChunker:
             Text with normalized whitespace
         """
         # Replace multiple spaces with single space
-        text = re.sub(r" +", " ", text)
+        text = _MULTI_SPACE_RE.sub(" ", text)
         # Replace multiple newlines with double newline
-        text = re.sub(r"\n{3,}", "\n\n", text)
+        text = _MULTI_NEWLINE_RE.sub("\n\n", text)
         return text.strip()
 
     def _recursive_chunk(
@@ -141,18 +156,25 @@ class TextChunker:
             return None
 
         chunks = []
-        current_chunk = ""
+        # The chunk being built, as pieces plus their total length; joined
+        # once when the chunk is emitted instead of re-concatenated per part
+        current_parts: list[str] = []
+        current_len = 0
         current_start = start_offset
+        last = len(parts) - 1
 
         for i, part in enumerate(parts):
             # Add separator back (except for last part)
-            part_with_sep = part + separator if i < len(parts) - 1 else part
-
-            if not current_chunk:
-                current_chunk = part_with_sep
-            elif len(current_chunk) + len(part_with_sep) <= self.config.chunk_size:
-                current_chunk += part_with_sep
+            part_with_sep = part + separator if i < last else part
+
+            if not current_len:
+                current_parts = [part_with_sep]
+                current_len = len(part_with_sep)
+            elif current_len + len(part_with_sep) <= self.config.chunk_size:
+                current_parts.append(part_with_sep)
+                current_len += len(part_with_sep)
             else:
+                current_chunk = "".join(current_parts)
                 # Save current chunk
                 if len(current_chunk.strip()) >= self.config.min_chunk_size:
                     chunks.append(
@@ -166,10 +188,12 @@ class TextChunker:
 
                 # Start new chunk with overlap
                 overlap_text = self._get_overlap(current_chunk)
-                current_start = current_start + len(current_chunk) - len(overlap_text)
-                current_chunk = overlap_text + part_with_sep
+                current_start = current_start + current_len - len(overlap_text)
+                current_parts = [overlap_text, part_with_sep]
+                current_len = len(overlap_text) + len(part_with_sep)
 
         # Don't forget the last chunk
+        current_chunk = "".join(current_parts)
         if current_chunk.strip() and len(current_chunk.strip()) >= self.config.min_chunk_size:
             chunks.append(
                 TextChunk(
@@ -259,7 +283,7 @@ def chunk_for_embedding(
     text: str,
     max_context: int = 512,
     overlap: int = 50,
-) -> list[TextChunk]:
+) -> Iterator[TextChunk]:
     """Convenience function to chunk text for embedding.
 
     Args:
@@ -268,7 +292,7 @@ def chunk_for_embedding(
         overlap: Overlap between chunks
 
     Returns:
-        List of TextChunk objects
+        Iterator of TextChunk objects (wrap in list() to materialize)
     """
     # Leave some room for prefixes
     chunk_size = int(max_context * 0.9 * 4)  # ~4 chars per token, 90% of context
@@ -278,4 +302,4 @@ def chunk_for_embedding(
         chunk_overlap=overlap,
     )
     chunker = TextChunker(config)
-    return chunker.chunk(text)
+    return chunker.iter_chunks(text)
@@ -1,6 +1,7 @@
 """Ollama client for generating embeddings."""
 
 import logging
+from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
 import httpx
@@ -108,6 +109,12 @@ class OllamaEmbedder:
                 "document_prefix": "",
             },
         )
+        # text_type -> prefix, resolved once instead of on every embed
+        self._prefixes = {
+            key.removesuffix("_prefix"): value
+            for key, value in self.config.items()
+            if key.endswith("_prefix")
+        }
 
         # Configure ollama client
         self._client = ollama.Client(host=host, timeout=httpx.Timeout(timeout))
@@ -131,9 +138,7 @@ class OllamaEmbedder:
         Returns:
             Text with appropriate prefix
         """
-        prefix_key = f"{text_type}_prefix"
-        prefix = self.config.get(prefix_key, "")
-        return f"{prefix}{text}"
+        return self._prefixes.get(text_type, "") + text
 
     async def embed(
         self,
@@ -205,19 +210,74 @@ class OllamaEmbedder:
     ) -> list[EmbeddingResult]:
         """Generate embeddings for multiple texts.
 
+        Cache misses are embedded with a single request to Ollama's batch
+        embed endpoint.
+
         Args:
             texts: List of texts to embed
             text_type: Either 'query' or 'document'
             use_cache: Whether to use cache
 
         Returns:
-            List of EmbeddingResults
+            List of EmbeddingResults, in input order
+
+        Raises:
+            RuntimeError: If the embedding request fails
         """
-        results = []
-        for text in texts:
-            result = await self.embed(text, text_type=text_type, use_cache=use_cache)
-            results.append(result)
-        return results
+        prefixed_texts = [self._apply_prefix(text, text_type) for text in texts]
+        results: list[EmbeddingResult | None] = [None] * len(texts)
+        misses: list[int] = []
+
+        for i, prefixed_text in enumerate(prefixed_texts):
+            cached = None
+            if use_cache and self.cache:
+                cached = await self.cache.get(prefixed_text, self.model)
+            if cached is not None:
+                results[i] = EmbeddingResult(
+                    embedding=cached,
+                    model=self.model,
+                    dimensions=len(cached),
+                    cached=True,
+                )
+            else:
+                misses.append(i)
+
+        if misses:
+            # Apply rate limiting (one request for the whole batch)
+            if self._rate_limiter:
+                await self._rate_limiter.acquire()
+
+            async def _do_embed() -> list[Sequence[float]]:
+                response = self._client.embed(
+                    model=self.model,
+                    input=[prefixed_texts[i] for i in misses],
+                )
+                return list(response["embeddings"])
+
+            try:
+                if self._circuit_breaker:
+                    embeddings = await self._circuit_breaker.call(_do_embed)
+                else:
+                    embeddings = await _do_embed()
+            except Exception as e:
+                logger.error(f"Error generating batch embeddings: {e}")
+                raise RuntimeError(f"Failed to generate embeddings: {e}") from e
+
+            for i, embedding in zip(misses, embeddings, strict=True):
+                embedding = list(embedding)
+                if use_cache and self.cache:
+                    await self.cache.set(prefixed_texts[i], self.model, embedding)
+                results[i] = EmbeddingResult(
+                    embedding=embedding,
+                    model=self.model,
+                    dimensions=len(embedding),
+                    cached=False,
+                )
+
+            logger.debug("Generated %d embeddings in one batch", len(misses))
+
+        # Every slot is filled by now, from the cache or the batch request
+        return [r for r in results if r is not None]
 
     async def check_connection(self) -> bool:
         """Check if Ollama server is accessible.
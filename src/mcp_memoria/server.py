@@ -1305,8 +1305,8 @@ class MemoriaServer:
                 for item in result["breakdown"]:
                     output.append(f"    {item['group']}: {item['hours']}h ({item['percentage']}%)")
             if result.get("recent_sessions"):
-                output.append(f"\n  Recent sessions ({len(result['recent_sessions'])} total):")
-                for s in result["recent_sessions"][:15]:
+                output.append(f"\n  Recent sessions ({result['total_sessions']} total):")
+                for s in result["recent_sessions"]:
                     output.append(f"    [{s['date']}] {s['description'][:40]}... ({s['duration_minutes']}m)")
             return "\n".join(output)
 
@@ -1323,9 +1323,14 @@ class MemoriaServer:
             return None
 
         if self.graph_manager is None:
-            # Lazy initialization
-            self._db = Database(self.settings.database_url)
-            await self._db.connect(run_migrations=self.settings.db_migrate)
+            # Lazy initialization, sharing the work tracker's pool if it exists
+            if self._db is None:
+                self._db = Database(
+                    self.settings.database_url,
+                    min_pool_size=self.settings.db_pool_min,
+                    max_pool_size=self.settings.db_pool_max,
+                )
+                await self._db.connect(run_migrations=self.settings.db_migrate)
             self.graph_manager = GraphManager(
                 database=self._db,
                 qdrant=self.memory_manager.vector_store,
@@ -1356,7 +1361,11 @@ class MemoriaServer:
 
         # Ensure database is connected
         if self._db is None:
-            self._db = Database(self.settings.database_url)
+            self._db = Database(
+                self.settings.database_url,
+                min_pool_size=self.settings.db_pool_min,
+                max_pool_size=self.settings.db_pool_max,
+            )
             await self._db.connect(run_migrations=self.settings.db_migrate)
 
         if self._work_tracker is None:
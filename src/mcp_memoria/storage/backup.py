@@ -1,12 +1,13 @@
 """Backup and restore functionality for memories."""
 
-import json
 import logging
 import os
 from datetime import datetime
 from pathlib import Path
 from typing import Any, AsyncIterator
 
+import orjson
+
 from mcp_memoria.storage.collections import CollectionManager, MemoryCollection
 from mcp_memoria.storage.qdrant_store import QdrantStore
 
@@ -19,6 +20,41 @@ class PathTraversalError(Exception):
     pass
 
 
+# Default allowed directories: home and temp, fixed for the process lifetime
+_DEFAULT_ALLOWED_DIRS: tuple[Path, ...] = (
+    Path.home(),
+    Path("/tmp"),
+    Path(os.environ.get("TMPDIR", "/tmp")),
+)
+
+
+def _allowed_prefixes(allowed_dirs: tuple[Path, ...]) -> tuple[str, ...]:
+    """Canonicalize allowed directories for prefix matching.
+
+    Each directory becomes its resolved, case-normalized path with a
+    trailing separator, so containment is a plain ``str.startswith``.
+    Directories that cannot be resolved are dropped, as they can never
+    contain a valid path.
+    """
+    prefixes = []
+    for allowed in allowed_dirs:
+        try:
+            prefixes.append(_as_prefix(allowed.resolve()))
+        except (OSError, ValueError):
+            continue
+    return tuple(prefixes)
+
+
+def _as_prefix(path: Path) -> str:
+    """Return path as a case-normalized string ending in a separator."""
+    return os.path.join(os.path.normcase(path), "")
+
+
+# The defaults are resolved once; caller-supplied directories are resolved
+# on every call, since a relative path or symlink may point elsewhere later
+_DEFAULT_ALLOWED_PREFIXES = _allowed_prefixes(_DEFAULT_ALLOWED_DIRS)
+
+
 def validate_safe_path(path: Path, allowed_dirs: list[Path] | None = None) -> Path:
     """Validate that a path is safe and doesn't escape allowed directories.
 
@@ -34,34 +70,29 @@ def validate_safe_path(path: Path, allowed_dirs: list[Path] | None = None) -> Pa
         PathTraversalError: If path escapes allowed directories
         ValueError: If path is invalid
     """
-    # Resolve to absolute path, following symlinks
+    # Resolve to absolute path, following symlinks. realpath is what
+    # Path.resolve() wraps, minus its extra stat() for loop detection; a
+    # symlink loop still fails with ELOOP when the file is opened.
     try:
-        resolved = path.resolve()
+        resolved = Path(os.path.realpath(path))
     except (OSError, ValueError) as e:
         raise ValueError(f"Invalid path: {path}") from e
 
-    # Default allowed directories: home and temp
     if allowed_dirs is None:
-        home = Path.home()
-        allowed_dirs = [
-            home,
-            Path("/tmp"),
-            Path(os.environ.get("TMPDIR", "/tmp")),
-        ]
-
-    # Check if resolved path is under any allowed directory
-    for allowed in allowed_dirs:
-        try:
-            allowed_resolved = allowed.resolve()
-            # Check if resolved path starts with allowed path
-            if resolved == allowed_resolved or allowed_resolved in resolved.parents:
-                return resolved
-        except (OSError, ValueError):
-            continue
+        allowed = _DEFAULT_ALLOWED_DIRS
+        prefixes = _DEFAULT_ALLOWED_PREFIXES
+    else:
+        allowed = tuple(allowed_dirs)
+        prefixes = _allowed_prefixes(allowed)
+
+    # Check if resolved path is (or is under) any allowed directory
+    candidate = _as_prefix(resolved)
+    if any(candidate.startswith(prefix) for prefix in prefixes):
+        return resolved
 
     raise PathTraversalError(
         f"Path '{path}' resolves to '{resolved}' which is outside allowed directories. "
-        f"Allowed: {[str(d) for d in allowed_dirs]}"
+        f"Allowed: {[str(d) for d in allowed]}"
     )
 
 
@@ -124,8 +155,8 @@ class MemoryBackup:
 
         # Write to file
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
+        with open(output_path, "wb") as f:
+            f.write(orjson.dumps(export_data, option=orjson.OPT_INDENT_2))
 
         logger.info(f"Export complete: {total_count} memories to {output_path}")
 
@@ -164,7 +195,7 @@ class MemoryBackup:
         counts = {}
         total_count = 0
 
-        with open(output_path, "w", encoding="utf-8") as f:
+        with open(output_path, "wb") as f:
             for memory_type in types_to_export:
                 if not self.collection_manager.collection_exists(memory_type):
                     continue
@@ -172,7 +203,7 @@ class MemoryBackup:
                 count = 0
                 async for memory in self._scroll_collection(memory_type, include_vectors):
                     memory["_collection"] = memory_type
-                    f.write(json.dumps(memory, ensure_ascii=False) + "\n")
+                    f.write(orjson.dumps(memory, option=orjson.OPT_APPEND_NEWLINE))
                     count += 1
                     total_count += 1
 
@@ -208,8 +239,8 @@ class MemoryBackup:
         # Validate path to prevent path traversal attacks
         input_path = validate_safe_path(input_path)
 
-        with open(input_path, encoding="utf-8") as f:
-            import_data = json.load(f)
+        with open(input_path, "rb") as f:
+            import_data = orjson.loads(f.read())
 
         # Validate format
         if "collections" not in import_data:
@@ -299,12 +330,12 @@ class MemoryBackup:
         counts: dict[str, int] = {}
         total_imported = 0
 
-        with open(input_path, encoding="utf-8") as f:
+        with open(input_path, "rb") as f:
             for line in f:
                 if not line.strip():
                     continue
 
-                memory = json.loads(line)
+                memory = orjson.loads(line)
                 memory_type = memory.pop("_collection", "episodic")
 
                 # Ensure collection exists
@@ -358,43 +389,32 @@ class MemoryBackup:
         Yields:
             Memory dicts
         """
-        offset = None
         seen_parents: set[str] = set()
 
-        while True:
-            results, next_offset = await self.store.scroll(
-                collection=collection,
-                limit=100,
-                offset=offset,
-                with_vectors=with_vectors,
-            )
-
-            for result in results:
-                parent_id = result.payload.get("parent_id", result.id)
+        async for result in self.store.scroll_iter(
+            collection=collection,
+            with_vectors=with_vectors,
+        ):
+            parent_id = result.payload.get("parent_id", result.id)
 
-                # Deduplicate: only export once per logical memory
-                if parent_id in seen_parents:
-                    continue
-                seen_parents.add(parent_id)
-
-                # Build clean payload: use full_content if available, strip chunk fields
-                payload = dict(result.payload)
-                if "full_content" in payload:
-                    payload["content"] = payload.pop("full_content")
-                # Remove chunk-specific fields from export
-                for chunk_field in ("is_chunk", "parent_id", "chunk_index", "chunk_count", "full_content"):
-                    payload.pop(chunk_field, None)
-
-                memory = {
-                    "id": parent_id,
-                    "payload": payload,
-                }
-                if with_vectors and result.vector:
-                    memory["vector"] = result.vector
-
-                yield memory
-
-            if not next_offset:
-                break
-
-            offset = next_offset
+            # Deduplicate: only export once per logical memory
+            if parent_id in seen_parents:
+                continue
+            seen_parents.add(parent_id)
+
+            # Build clean payload: use full_content if available, strip chunk fields
+            payload = dict(result.payload)
+            if "full_content" in payload:
+                payload["content"] = payload.pop("full_content")
+            # Remove chunk-specific fields from export
+            for chunk_field in ("is_chunk", "parent_id", "chunk_index", "chunk_count", "full_content"):
+                payload.pop(chunk_field, None)
+
+            memory = {
+                "id": parent_id,
+                "payload": payload,
+            }
+            if with_vectors and result.vector:
+                memory["vector"] = result.vector
+
+            yield memory
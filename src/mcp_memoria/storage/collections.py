@@ -25,6 +25,17 @@ class MemoryCollection(str, Enum):
     PROCEDURAL = "procedural"
 
 
+# Payload indexes shared by all collections: the keys that recall/search
+# filters are built on (see MemoryManager.search and QdrantStore._build_filter)
+COMMON_PAYLOAD_INDEXES: dict[str, PayloadSchemaType] = {
+    "memory_type": PayloadSchemaType.KEYWORD,
+    "tags": PayloadSchemaType.KEYWORD,
+    "project": PayloadSchemaType.KEYWORD,
+    "importance": PayloadSchemaType.FLOAT,
+    "created_at": PayloadSchemaType.DATETIME,
+    "accessed_at": PayloadSchemaType.DATETIME,
+}
+
 # Collection configurations
 COLLECTION_CONFIGS: dict[MemoryCollection, dict[str, Any]] = {
     MemoryCollection.EPISODIC: {
@@ -35,10 +46,6 @@ COLLECTION_CONFIGS: dict[MemoryCollection, dict[str, Any]] = {
             full_scan_threshold=10000,
         ),
         "payload_indexes": {
-            "timestamp": PayloadSchemaType.DATETIME,
-            "tags": PayloadSchemaType.KEYWORD,
-            "project": PayloadSchemaType.KEYWORD,
-            "importance": PayloadSchemaType.FLOAT,
             "session_id": PayloadSchemaType.KEYWORD,
         },
     },
@@ -53,7 +60,6 @@ COLLECTION_CONFIGS: dict[MemoryCollection, dict[str, Any]] = {
             "domain": PayloadSchemaType.KEYWORD,
             "source": PayloadSchemaType.KEYWORD,
             "confidence": PayloadSchemaType.FLOAT,
-            "tags": PayloadSchemaType.KEYWORD,
         },
     },
     MemoryCollection.PROCEDURAL: {
@@ -67,7 +73,6 @@ COLLECTION_CONFIGS: dict[MemoryCollection, dict[str, Any]] = {
             "category": PayloadSchemaType.KEYWORD,
             "success_rate": PayloadSchemaType.FLOAT,
             "frequency": PayloadSchemaType.INTEGER,
-            "tags": PayloadSchemaType.KEYWORD,
         },
     },
 }
@@ -140,8 +145,10 @@ class CollectionManager:
             # Create payload indexes
             await self._create_payload_indexes(collection)
 
-        # Always attempt to create text and chunk indexes (idempotent via try/except)
+        # Always attempt to create text, filter-key and chunk indexes
+        # (idempotent via try/except), so existing collections gain them too
         await self.create_text_index(collection, field_name="content")
+        await self._create_common_indexes(collection)
         await self._create_chunk_indexes(collection)
 
         return created
@@ -167,6 +174,23 @@ class CollectionManager:
                 # Index might already exist
                 logger.debug(f"Index {field_name} on {collection.value}: {e}")
 
+    async def _create_common_indexes(self, collection: MemoryCollection) -> None:
+        """Create payload indexes on the keys used by search filters.
+
+        Args:
+            collection: Collection type
+        """
+        for field_name, field_type in COMMON_PAYLOAD_INDEXES.items():
+            try:
+                self.store.client.create_payload_index(
+                    collection_name=collection.value,
+                    field_name=field_name,
+                    field_schema=field_type,
+                )
+                logger.debug(f"Created index {field_name} on {collection.value}")
+            except Exception as e:
+                logger.debug(f"Index {field_name} on {collection.value}: {e}")
+
     async def _create_chunk_indexes(self, collection: MemoryCollection) -> None:
         """Create payload indexes for chunk-related fields.
 
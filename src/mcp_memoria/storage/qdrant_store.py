@@ -1,13 +1,23 @@
 """Qdrant vector store implementation with async support."""
 
+import asyncio
 import logging
+import os
+import time
+from collections.abc import AsyncIterator, Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any
-from uuid import uuid4
+from typing import Any, Literal, TypeVar
+from uuid import UUID, uuid4
 
-from pydantic import BaseModel
+import numpy as np
 from qdrant_client import AsyncQdrantClient, QdrantClient
+from qdrant_client import grpc as qdrant_grpc
+from qdrant_client.conversions.conversion import RestToGrpc
 from qdrant_client.models import (
+    Batch,
     DatetimeRange,
     Distance,
     FieldCondition,
@@ -16,8 +26,14 @@ from qdrant_client.models import (
     MatchText,
     MatchValue,
     PointStruct,
+    QuantizationSearchParams,
     Range,
+    Record,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
     ScoredPoint,
+    SearchParams,
     VectorParams,
 )
 
@@ -25,21 +41,51 @@ from mcp_memoria.core.rate_limiter import CircuitBreaker, QDRANT_CIRCUIT_CONFIG
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
 
-class SearchResult(BaseModel):
-    """Result from a vector search."""
+# Vectors may be passed as numpy arrays or plain float sequences
+VectorLike = np.ndarray | Sequence[float]
+
+# Worker threads for sync-client calls in local and in-memory modes
+SYNC_WORKERS = 4
+
+# Seconds a positive collection-existence check is trusted without a request
+COLLECTION_CACHE_TTL = 60.0
+
+
+@dataclass(slots=True)
+class SearchResult:
+    """Result from a vector search.
+
+    A plain slotted dataclass rather than a pydantic model: results are
+    built for every returned point, and Qdrant has already validated them.
+    """
 
     id: str
     score: float
     payload: dict[str, Any]
     vector: list[float] | None = None
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a plain dict.
+
+        Returns:
+            Dict with id, score, payload and vector
+        """
+        return {
+            "id": self.id,
+            "score": self.score,
+            "payload": self.payload,
+            "vector": self.vector,
+        }
+
 
 class QdrantStore:
     """Qdrant vector store for memory storage.
 
     Uses AsyncQdrantClient for true async I/O when connected to a server.
-    Falls back to sync client for local/in-memory mode (wrapped in async).
+    Falls back to sync client for local/in-memory mode, run in a worker
+    thread so the event loop is never blocked.
     """
 
     def __init__(
@@ -47,55 +93,103 @@ class QdrantStore:
         path: Path | None = None,
         host: str | None = None,
         port: int = 6333,
+        grpc_port: int = 6334,
+        prefer_grpc: bool = True,
+        pool_size: int = 100,
         vector_size: int = 768,
         distance: Distance = Distance.COSINE,
         enable_circuit_breaker: bool = True,
+        quantization: Literal["none", "scalar"] = "none",
     ):
         """Initialize Qdrant store.
 
         Args:
             path: Local storage path (for local mode)
             host: Qdrant server host (for server mode)
-            port: Qdrant server port
+            port: Qdrant server REST port
+            grpc_port: Qdrant server gRPC port (used when prefer_grpc is set)
+            prefer_grpc: Use gRPC for server mode. Writes keep the same
+                wait/ordering semantics as REST; only the transport changes.
+            pool_size: Connection pool size for server mode, bounding how many
+                requests can be in flight at once
             vector_size: Dimension of vectors
             distance: Distance metric
             enable_circuit_breaker: Enable circuit breaker for remote connections
+            quantization: "scalar" stores new collections' vectors as int8 (in
+                RAM) and rescores the top candidates with the original vectors
         """
         self.vector_size = vector_size
         self.distance = distance
+        self.quantization = quantization
+        # Per-search quantization params; only set in server mode, as local
+        # mode always does exact search
+        self._search_params: SearchParams | None = None
         self._is_async = False
+        # Build gRPC point messages directly for batch upserts (server mode)
+        self._grpc_points = False
         self._circuit_breaker: CircuitBreaker | None = None
 
         # Store for sync operations (collection management)
         self._sync_client: QdrantClient | None = None
         # Store for async operations (data operations)
         self._async_client: AsyncQdrantClient | None = None
+        # Dedicated worker threads for sync-client calls (local/in-memory modes)
+        self._executor: ThreadPoolExecutor | None = None
+        # Collection name -> monotonic time it was last seen to exist
+        self._collection_cache: dict[str, float] = {}
 
         if path:
             # Local mode with persistence - use sync client
             path.mkdir(parents=True, exist_ok=True)
             self._sync_client = QdrantClient(path=str(path))
             self.client = self._sync_client  # For backward compat
+            self._executor = self._create_executor()
             logger.info(f"Qdrant initialized in local mode at {path}")
         elif host:
             # Server mode - use async client
-            self._async_client = AsyncQdrantClient(host=host, port=port)
-            self._sync_client = QdrantClient(host=host, port=port)
+            client_kwargs: dict[str, Any] = {
+                "host": host,
+                "port": port,
+                "grpc_port": grpc_port,
+                "prefer_grpc": prefer_grpc,
+                "pool_size": pool_size,
+            }
+            self._async_client = AsyncQdrantClient(**client_kwargs)
+            self._sync_client = QdrantClient(**client_kwargs)
             self.client = self._sync_client  # For sync operations like collection_exists
             self._is_async = True
+            self._grpc_points = prefer_grpc
             if enable_circuit_breaker:
                 self._circuit_breaker = CircuitBreaker("qdrant", QDRANT_CIRCUIT_CONFIG)
-            logger.info(f"Qdrant connected to {host}:{port} (async mode)")
+            if quantization != "none":
+                self._search_params = SearchParams(
+                    quantization=QuantizationSearchParams(rescore=True, oversampling=2.0)
+                )
+            transport = f"gRPC :{grpc_port}" if prefer_grpc else "REST"
+            logger.info(f"Qdrant connected to {host}:{port} (async mode, {transport})")
         else:
             # In-memory mode - use sync client
             self._sync_client = QdrantClient(":memory:")
             self.client = self._sync_client
+            self._executor = self._create_executor()
             logger.info("Qdrant initialized in memory mode")
 
+    @staticmethod
+    def _create_executor() -> ThreadPoolExecutor:
+        """Create the worker pool for sync-client calls.
+
+        Kept separate from the loop's default executor so Qdrant I/O can't
+        starve (or be starved by) other libraries using asyncio.to_thread.
+        """
+        return ThreadPoolExecutor(max_workers=SYNC_WORKERS, thread_name_prefix="qdrant")
+
     async def close(self) -> None:
-        """Close async client connection."""
+        """Close async client connection and stop sync worker threads."""
         if self._async_client:
             await self._async_client.close()
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
 
     def create_collection(
         self,
@@ -118,9 +212,11 @@ class QdrantStore:
         if self.client.collection_exists(name):
             if recreate:
                 self.client.delete_collection(name)
+                self._collection_cache.pop(name, None)
                 logger.info(f"Deleted existing collection: {name}")
             else:
-                logger.debug(f"Collection {name} already exists")
+                self._collection_cache[name] = time.monotonic()
+                logger.debug("Collection %s already exists", name)
                 return False
 
         self.client.create_collection(
@@ -129,10 +225,28 @@ class QdrantStore:
                 size=vector_size or self.vector_size,
                 distance=distance or self.distance,
             ),
+            quantization_config=self._quantization_config(),
         )
+        self._collection_cache[name] = time.monotonic()
         logger.info(f"Created collection: {name}")
         return True
 
+    def _quantization_config(self) -> ScalarQuantization | None:
+        """Build the quantization config for new collections.
+
+        Returns:
+            Scalar int8 quantization config, or None if disabled
+        """
+        if self.quantization != "scalar":
+            return None
+        return ScalarQuantization(
+            scalar=ScalarQuantizationConfig(
+                type=ScalarType.INT8,
+                quantile=0.99,
+                always_ram=True,
+            )
+        )
+
     def delete_collection(self, name: str) -> bool:
         """Delete a collection.
 
@@ -142,6 +256,7 @@ class QdrantStore:
         Returns:
             True if deleted, False if not found
         """
+        self._collection_cache.pop(name, None)
         if not self.client.collection_exists(name):
             return False
 
@@ -152,13 +267,26 @@ class QdrantStore:
     def collection_exists(self, name: str) -> bool:
         """Check if collection exists.
 
+        Positive answers are cached for COLLECTION_CACHE_TTL seconds, since
+        collections are long-lived; negative answers are always re-checked.
+
         Args:
             name: Collection name
 
         Returns:
             True if exists
         """
-        return self.client.collection_exists(name)
+        now = time.monotonic()
+        seen_at = self._collection_cache.get(name)
+        if seen_at is not None and now - seen_at < COLLECTION_CACHE_TTL:
+            return True
+
+        exists = self.client.collection_exists(name)
+        if exists:
+            self._collection_cache[name] = now
+        else:
+            self._collection_cache.pop(name, None)
+        return exists
 
     def get_collection_info(self, name: str) -> dict[str, Any]:
         """Get collection information.
@@ -180,7 +308,7 @@ class QdrantStore:
     async def upsert(
         self,
         collection: str,
-        vector: list[float],
+        vector: VectorLike,
         payload: dict[str, Any],
         id: str | None = None,
     ) -> str:
@@ -194,7 +322,12 @@ class QdrantStore:
 
         Returns:
             Point ID
+
+        Raises:
+            ValueError: If the vector length does not match the store's vector size
         """
+        vector = _as_f32(vector)
+        self._validate_vector(vector)
         point_id = id or str(uuid4())
         point = PointStruct(id=point_id, vector=vector, payload=payload)
 
@@ -210,9 +343,9 @@ class QdrantStore:
             else:
                 await _do_upsert()
         else:
-            self.client.upsert(collection_name=collection, points=[point])
+            await self._run_sync(self.client.upsert, collection_name=collection, points=[point])
 
-        logger.debug(f"Upserted point {point_id} to {collection}")
+        logger.debug("Upserted point %s to %s", point_id, collection)
         return point_id
 
     async def upsert_batch(
@@ -222,26 +355,78 @@ class QdrantStore:
     ) -> list[str]:
         """Insert or update multiple points.
 
+        Thin wrapper over upsert_vectors for callers holding per-point tuples.
+
         Args:
             collection: Collection name
             points: List of (vector, payload, optional_id) tuples
 
         Returns:
             List of point IDs
+
+        Raises:
+            ValueError: If any vector length does not match the store's vector size
         """
-        point_structs = []
-        ids = []
+        if not points:
+            return []
+
+        vectors, payloads, ids = zip(*points, strict=True)
+        return await self.upsert_vectors(
+            collection=collection,
+            vectors=np.asarray(vectors, dtype=np.float32),
+            payloads=list(payloads),
+            ids=list(ids),
+        )
 
-        for vector, payload, point_id in points:
-            pid = point_id or str(uuid4())
-            ids.append(pid)
-            point_structs.append(PointStruct(id=pid, vector=vector, payload=payload))
+    async def upsert_vectors(
+        self,
+        collection: str,
+        vectors: np.ndarray | list[list[float]],
+        payloads: list[dict[str, Any]],
+        ids: list[str | None] | None = None,
+    ) -> list[str]:
+        """Insert or update multiple points from column-oriented data.
+
+        Vectors are handled as a single (N, D) float32 array, so dimension
+        checks and conversion happen once for the whole batch instead of
+        per point, and the points are sent as one Qdrant Batch.
+
+        Args:
+            collection: Collection name
+            vectors: Array (or nested list) of shape (N, vector_size)
+            payloads: N payload dicts
+            ids: Optional N point IDs (None entries are generated)
+
+        Returns:
+            List of point IDs
+
+        Raises:
+            ValueError: If the shapes don't match vector_size or each other
+        """
+        matrix = np.asarray(vectors, dtype=np.float32)
+        if matrix.ndim != 2 or matrix.shape[1] != self.vector_size:
+            raise ValueError(
+                f"Vector dimension mismatch: expected (N, {self.vector_size}), "
+                f"got {matrix.shape}"
+            )
+        if len(payloads) != matrix.shape[0] or (ids is not None and len(ids) != len(payloads)):
+            raise ValueError("vectors, payloads and ids must have the same length")
+
+        if ids is None:
+            point_ids = _random_uuids(len(payloads))
+        else:
+            fresh = iter(_random_uuids(sum(1 for pid in ids if not pid)))
+            point_ids = [pid or next(fresh) for pid in ids]
+        if self._grpc_points:
+            batch = _to_grpc_points(point_ids, matrix, payloads)
+        else:
+            batch = Batch(ids=point_ids, vectors=matrix.tolist(), payloads=payloads)
 
         if self._is_async and self._async_client:
             async def _do_upsert():
                 await self._async_client.upsert(
                     collection_name=collection,
-                    points=point_structs,
+                    points=batch,
                 )
 
             if self._circuit_breaker:
@@ -249,19 +434,20 @@ class QdrantStore:
             else:
                 await _do_upsert()
         else:
-            self.client.upsert(collection_name=collection, points=point_structs)
+            await self._run_sync(self.client.upsert, collection_name=collection, points=batch)
 
-        logger.debug(f"Upserted {len(points)} points to {collection}")
-        return ids
+        logger.debug("Upserted %d points to %s", len(point_ids), collection)
+        return point_ids
 
     async def search(
         self,
         collection: str,
-        vector: list[float],
+        vector: VectorLike,
         limit: int = 5,
         score_threshold: float | None = None,
         filter_conditions: dict[str, Any] | None = None,
         with_vectors: bool = False,
+        with_payload: bool | list[str] = True,
     ) -> list[SearchResult]:
         """Search for similar vectors.
 
@@ -272,11 +458,14 @@ class QdrantStore:
             score_threshold: Minimum similarity score
             filter_conditions: Payload filter conditions
             with_vectors: Include vectors in results
+            with_payload: Return full payloads (True), none (False), or only
+                the listed payload fields
 
         Returns:
             List of SearchResults
         """
-        qdrant_filter = self._build_filter(filter_conditions) if filter_conditions else None
+        vector = _as_f32(vector)
+        qdrant_filter = self._build_filter(filter_conditions)
 
         if self._is_async and self._async_client:
             async def _do_search():
@@ -287,6 +476,8 @@ class QdrantStore:
                     score_threshold=score_threshold,
                     query_filter=qdrant_filter,
                     with_vectors=with_vectors,
+                    with_payload=with_payload,
+                    search_params=self._search_params,
                 )
 
             if self._circuit_breaker:
@@ -294,17 +485,63 @@ class QdrantStore:
             else:
                 response = await _do_search()
         else:
-            response = self.client.query_points(
+            response = await self._run_sync(
+                self.client.query_points,
                 collection_name=collection,
                 query=vector,
                 limit=limit,
                 score_threshold=score_threshold,
                 query_filter=qdrant_filter,
                 with_vectors=with_vectors,
+                with_payload=with_payload,
             )
 
         return [self._scored_point_to_result(r) for r in response.points]
 
+    async def search_many_collections(
+        self,
+        collections: list[str],
+        vector: VectorLike,
+        limit: int = 5,
+        score_threshold: float | None = None,
+        filter_conditions: dict[str, Any] | None = None,
+        with_vectors: bool = False,
+        with_payload: bool | list[str] = True,
+    ) -> dict[str, list[SearchResult]]:
+        """Search several collections concurrently with the same query vector.
+
+        A batch query is scoped to one collection, so memory types (one
+        collection each) are fanned out concurrently instead.
+
+        Args:
+            collections: Collection names
+            vector: Query vector
+            limit: Maximum results per collection
+            score_threshold: Minimum similarity score
+            filter_conditions: Payload filter conditions
+            with_vectors: Include vectors in results
+            with_payload: Return full payloads, none, or only the listed fields
+
+        Returns:
+            Dict of collection name -> SearchResults
+        """
+        vector = _as_f32(vector)
+        responses = await asyncio.gather(
+            *[
+                self.search(
+                    collection=collection,
+                    vector=vector,
+                    limit=limit,
+                    score_threshold=score_threshold,
+                    filter_conditions=filter_conditions,
+                    with_vectors=with_vectors,
+                    with_payload=with_payload,
+                )
+                for collection in collections
+            ]
+        )
+        return dict(zip(collections, responses, strict=True))
+
     async def get(
         self,
         collection: str,
@@ -328,27 +565,22 @@ class QdrantStore:
                 with_vectors=with_vectors,
             )
         else:
-            points = self.client.retrieve(
+            points = await self._run_sync(
+                self.client.retrieve,
                 collection_name=collection,
                 ids=ids,
                 with_vectors=with_vectors,
             )
 
-        return [
-            SearchResult(
-                id=str(p.id),
-                score=1.0,
-                payload=p.payload or {},
-                vector=p.vector if with_vectors else None,
-            )
-            for p in points
-        ]
+        return [self._record_to_result(p, with_vectors) for p in points]
 
     async def delete(
         self,
         collection: str,
         ids: list[str] | None = None,
         filter_conditions: dict[str, Any] | None = None,
+        return_count: bool = False,
+        exact_count: bool = False,
     ) -> int:
         """Delete points.
 
@@ -356,9 +588,13 @@ class QdrantStore:
             collection: Collection name
             ids: Point IDs to delete
             filter_conditions: Delete by filter
+            return_count: For filter deletes, count matching points first
+                (one extra request); otherwise the count is not known
+            exact_count: Use an exact count instead of Qdrant's estimate
 
         Returns:
-            Number of points deleted (approximate)
+            Number of points deleted (approximate for filter deletes), or -1
+            for a filter delete without return_count
         """
         if ids:
             if self._is_async and self._async_client:
@@ -367,42 +603,40 @@ class QdrantStore:
                     points_selector=ids,
                 )
             else:
-                self.client.delete(
+                await self._run_sync(
+                    self.client.delete,
                     collection_name=collection,
                     points_selector=ids,
                 )
-            logger.debug(f"Deleted {len(ids)} points from {collection}")
+            logger.debug("Deleted %d points from %s", len(ids), collection)
             return len(ids)
 
-        if filter_conditions:
-            qdrant_filter = self._build_filter(filter_conditions)
+        qdrant_filter = self._build_filter(filter_conditions)
+        if qdrant_filter is None:
+            return 0
 
-            if self._is_async and self._async_client:
-                count_result = await self._async_client.count(
-                    collection_name=collection,
-                    count_filter=qdrant_filter,
-                    exact=True,
-                )
-                count_before = count_result.count
-                await self._async_client.delete(
-                    collection_name=collection,
-                    points_selector=qdrant_filter,
-                )
-            else:
-                count_before = self.client.count(
-                    collection_name=collection,
-                    count_filter=qdrant_filter,
-                    exact=True,
-                ).count
-                self.client.delete(
-                    collection_name=collection,
-                    points_selector=qdrant_filter,
-                )
+        count_before = -1
+        if return_count:
+            count_before = await self.count(
+                collection=collection,
+                filter_conditions=filter_conditions,
+                exact=exact_count,
+            )
 
-            logger.debug(f"Deleted ~{count_before} points from {collection} by filter")
-            return count_before
+        if self._is_async and self._async_client:
+            await self._async_client.delete(
+                collection_name=collection,
+                points_selector=qdrant_filter,
+            )
+        else:
+            await self._run_sync(
+                self.client.delete,
+                collection_name=collection,
+                points_selector=qdrant_filter,
+            )
 
-        return 0
+        logger.debug("Deleted ~%d points from %s by filter", count_before, collection)
+        return count_before
 
     async def update_payload(
         self,
@@ -422,35 +656,68 @@ class QdrantStore:
         Returns:
             True if successful
         """
+        await self._set_payload(collection, payload, [id], merge)
+        logger.debug("Updated payload for %s in %s", id, collection)
+        return True
+
+    async def update_payload_batch(
+        self,
+        collection: str,
+        updates: list[tuple[str, dict[str, Any]]],
+        merge: bool = True,
+    ) -> int:
+        """Update payloads of many points with as few requests as possible.
+
+        Points receiving an identical payload are grouped and updated with a
+        single set/overwrite request.
+
+        Args:
+            collection: Collection name
+            updates: List of (point_id, payload) tuples
+            merge: If True, merge with existing; if False, overwrite
+
+        Returns:
+            Number of points updated
+        """
+        groups: dict[Any, tuple[dict[str, Any], list[str]]] = {}
+        for point_id, payload in updates:
+            try:
+                key = _freeze(payload)
+            except TypeError:
+                key = id(payload)
+            groups.setdefault(key, (payload, []))[1].append(point_id)
+
+        for payload, point_ids in groups.values():
+            await self._set_payload(collection, payload, point_ids, merge)
+
+        logger.debug(
+            "Updated payload for %d points in %s with %d requests",
+            len(updates),
+            collection,
+            len(groups),
+        )
+        return len(updates)
+
+    async def _set_payload(
+        self,
+        collection: str,
+        payload: dict[str, Any],
+        points: list[str],
+        merge: bool,
+    ) -> None:
+        """Set or overwrite the payload of the given points in one request."""
         if self._is_async and self._async_client:
-            if merge:
-                await self._async_client.set_payload(
-                    collection_name=collection,
-                    payload=payload,
-                    points=[id],
-                )
-            else:
-                await self._async_client.overwrite_payload(
-                    collection_name=collection,
-                    payload=payload,
-                    points=[id],
-                )
+            async_method = (
+                self._async_client.set_payload
+                if merge
+                else self._async_client.overwrite_payload
+            )
+            await async_method(collection_name=collection, payload=payload, points=points)
         else:
-            if merge:
-                self.client.set_payload(
-                    collection_name=collection,
-                    payload=payload,
-                    points=[id],
-                )
-            else:
-                self.client.overwrite_payload(
-                    collection_name=collection,
-                    payload=payload,
-                    points=[id],
-                )
-
-        logger.debug(f"Updated payload for {id} in {collection}")
-        return True
+            sync_method = self.client.set_payload if merge else self.client.overwrite_payload
+            await self._run_sync(
+                sync_method, collection_name=collection, payload=payload, points=points
+            )
 
     async def scroll(
         self,
@@ -472,7 +739,7 @@ class QdrantStore:
         Returns:
             Tuple of (results, next_offset)
         """
-        qdrant_filter = self._build_filter(filter_conditions) if filter_conditions else None
+        qdrant_filter = self._build_filter(filter_conditions)
 
         if self._is_async and self._async_client:
             points, next_offset = await self._async_client.scroll(
@@ -483,7 +750,8 @@ class QdrantStore:
                 with_vectors=with_vectors,
             )
         else:
-            points, next_offset = self.client.scroll(
+            points, next_offset = await self._run_sync(
+                self.client.scroll,
                 collection_name=collection,
                 limit=limit,
                 offset=offset,
@@ -491,18 +759,42 @@ class QdrantStore:
                 with_vectors=with_vectors,
             )
 
-        results = [
-            SearchResult(
-                id=str(p.id),
-                score=1.0,
-                payload=p.payload or {},
-                vector=p.vector if with_vectors else None,
-            )
-            for p in points
-        ]
+        results = [self._record_to_result(p, with_vectors) for p in points]
 
         return results, next_offset
 
+    async def scroll_iter(
+        self,
+        collection: str,
+        page_size: int = 512,
+        filter_conditions: dict[str, Any] | None = None,
+        with_vectors: bool = False,
+    ) -> AsyncIterator[SearchResult]:
+        """Iterate over all points, one scroll page in memory at a time.
+
+        Args:
+            collection: Collection name
+            page_size: Points fetched per scroll request
+            filter_conditions: Filter conditions
+            with_vectors: Include vectors
+
+        Yields:
+            SearchResults in scroll order
+        """
+        offset = None
+        while True:
+            results, offset = await self.scroll(
+                collection=collection,
+                limit=page_size,
+                offset=offset,
+                filter_conditions=filter_conditions,
+                with_vectors=with_vectors,
+            )
+            for result in results:
+                yield result
+            if not offset:
+                break
+
     async def count(
         self,
         collection: str,
@@ -519,7 +811,7 @@ class QdrantStore:
         Returns:
             Number of points
         """
-        qdrant_filter = self._build_filter(filter_conditions) if filter_conditions else None
+        qdrant_filter = self._build_filter(filter_conditions)
 
         if self._is_async and self._async_client:
             result = await self._async_client.count(
@@ -528,7 +820,8 @@ class QdrantStore:
                 exact=exact,
             )
         else:
-            result = self.client.count(
+            result = await self._run_sync(
+                self.client.count,
                 collection_name=collection,
                 count_filter=qdrant_filter,
                 exact=exact,
@@ -536,68 +829,63 @@ class QdrantStore:
 
         return result.count
 
-    def _build_filter(self, conditions: dict[str, Any]) -> Filter:
+    async def _run_sync(self, func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        """Run a blocking sync-client call off the event loop.
+
+        Local and in-memory modes only have a sync client; running it in a
+        dedicated worker thread lets other coroutines progress while it does
+        disk I/O.
+
+        Args:
+            func: Sync client method
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            The result of func
+        """
+        if self._executor is None:
+            return await asyncio.to_thread(func, *args, **kwargs)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+    def _validate_vector(self, vector: VectorLike) -> None:
+        """Check vector dimensions locally before sending to Qdrant.
+
+        A mismatch would otherwise cost a round trip and a server-side error.
+
+        Args:
+            vector: Vector to validate
+
+        Raises:
+            ValueError: If the vector length does not match vector_size
+        """
+        if len(vector) != self.vector_size:
+            raise ValueError(
+                f"Vector dimension mismatch: expected {self.vector_size}, got {len(vector)}"
+            )
+
+    def _build_filter(self, conditions: dict[str, Any] | None) -> Filter | None:
         """Build Qdrant filter from conditions dict.
 
+        Identical conditions (same project/tags/type) recur across calls, so
+        built filters are cached by a hashable form of the dict.
+
         Args:
             conditions: Filter conditions
 
         Returns:
-            Qdrant Filter object
+            Qdrant Filter object, or None if there is nothing to filter on
         """
-        must_conditions = []
-
-        for key, value in conditions.items():
-            if key == "__text_match":
-                # Split into words and create AND conditions for each word
-                # This ensures all words must be present (AND logic)
-                # Lowercase for case-insensitive matching
-                words = value.lower().split()
-                for word in words:
-                    word = word.strip()
-                    if word:
-                        must_conditions.append(
-                            FieldCondition(key="content", match=MatchText(text=word))
-                        )
-            elif isinstance(value, dict):
-                if "gte" in value or "lte" in value or "gt" in value or "lt" in value:
-                    # Detect if values are datetime strings (ISO format)
-                    sample = next((v for v in value.values() if v is not None), None)
-                    is_datetime = isinstance(sample, str) and ("T" in sample or len(sample) == 10)
-                    if is_datetime:
-                        must_conditions.append(
-                            FieldCondition(
-                                key=key,
-                                range=DatetimeRange(
-                                    gte=value.get("gte"),
-                                    lte=value.get("lte"),
-                                    gt=value.get("gt"),
-                                    lt=value.get("lt"),
-                                ),
-                            )
-                        )
-                    else:
-                        must_conditions.append(
-                            FieldCondition(
-                                key=key,
-                                range=Range(
-                                    gte=value.get("gte"),
-                                    lte=value.get("lte"),
-                                    gt=value.get("gt"),
-                                    lt=value.get("lt"),
-                                ),
-                            )
-                        )
-            elif isinstance(value, list):
-                must_conditions.append(
-                    FieldCondition(key=key, match=MatchAny(any=value))
-                )
-            else:
-                must_conditions.append(
-                    FieldCondition(key=key, match=MatchValue(value=value))
-                )
+        if not conditions:
+            return None
 
-        return Filter(must=must_conditions)
+        try:
+            frozen = tuple(sorted((k, _freeze(v)) for k, v in conditions.items()))
+        except TypeError:
+            # Unhashable values: build without caching
+            return _conditions_to_filter(conditions)
+        return _build_filter_cached(frozen)
 
     def _scored_point_to_result(self, point: ScoredPoint) -> SearchResult:
         """Convert ScoredPoint to SearchResult.
@@ -608,9 +896,187 @@ class QdrantStore:
         Returns:
             SearchResult
         """
+        point_id = point.id
         return SearchResult(
-            id=str(point.id),
-            score=point.score,
-            payload=point.payload or {},
-            vector=point.vector if hasattr(point, "vector") else None,
+            point_id if type(point_id) is str else str(point_id),
+            point.score,
+            point.payload or {},
+            point.vector,
+        )
+
+    def _record_to_result(self, point: Record, with_vectors: bool) -> SearchResult:
+        """Convert a retrieved/scrolled Record to SearchResult.
+
+        Args:
+            point: Qdrant Record
+            with_vectors: Whether the vector was requested
+
+        Returns:
+            SearchResult with a fixed score of 1.0
+        """
+        point_id = point.id
+        return SearchResult(
+            point_id if type(point_id) is str else str(point_id),
+            1.0,
+            point.payload or {},
+            point.vector if with_vectors else None,
+        )
+
+
+def _as_f32(vector: VectorLike) -> np.ndarray:
+    """Convert a vector to a contiguous float32 array (no copy if it already is one).
+
+    Args:
+        vector: Numpy array or sequence of floats
+
+    Returns:
+        1-D float32 array
+    """
+    return np.ascontiguousarray(vector, dtype=np.float32)
+
+
+def _random_uuids(n: int) -> list[str]:
+    """Generate n random (version 4) UUID strings.
+
+    Reads the randomness for the whole batch with a single os.urandom call
+    instead of one per uuid4().
+
+    Args:
+        n: Number of UUIDs
+
+    Returns:
+        List of UUID strings
+    """
+    rnd = os.urandom(16 * n)
+    return [str(UUID(bytes=rnd[i : i + 16], version=4)) for i in range(0, 16 * n, 16)]
+
+
+def _to_grpc_points(
+    ids: list[str],
+    matrix: np.ndarray,
+    payloads: list[dict[str, Any]],
+) -> list[Any]:
+    """Build gRPC point messages for an upsert without pydantic models.
+
+    The gRPC client would otherwise validate a Batch model and then convert
+    it point by point; creating the protobuf messages directly skips both.
+
+    Args:
+        ids: Point IDs
+        matrix: (N, D) float32 vectors
+        payloads: Payload dicts
+
+    Returns:
+        List of qdrant_client.grpc.PointStruct messages
+    """
+    return [
+        qdrant_grpc.PointStruct(
+            id=RestToGrpc.convert_extended_point_id(point_id),
+            vectors=qdrant_grpc.Vectors(
+                vector=qdrant_grpc.Vector(dense=qdrant_grpc.DenseVector(data=vector))
+            ),
+            payload=RestToGrpc.convert_payload(payload),
         )
+        for point_id, vector, payload in zip(ids, matrix.tolist(), payloads, strict=True)
+    ]
+
+
+def _freeze(value: Any) -> Any:
+    """Convert a filter condition value to a hashable form.
+
+    Every value is tagged with its type, so that equal-but-distinct values
+    such as True, 1 and 1.0 get different keys. Lists become tagged tuples
+    and dicts tagged frozensets of items; _thaw reverses the conversion.
+    """
+    if isinstance(value, list):
+        return (list, tuple(_freeze(v) for v in value))
+    if isinstance(value, dict):
+        return (dict, frozenset((k, _freeze(v)) for k, v in value.items()))
+    hash(value)
+    return (type(value), value)
+
+
+def _thaw(value: Any) -> Any:
+    """Convert a value produced by _freeze back to lists and dicts."""
+    kind, inner = value
+    if kind is list:
+        return [_thaw(v) for v in inner]
+    if kind is dict:
+        return {k: _thaw(v) for k, v in inner}
+    return inner
+
+
+@lru_cache(maxsize=256)
+def _build_filter_cached(frozen_conditions: tuple[tuple[str, Any], ...]) -> Filter | None:
+    """Build (and cache) a Qdrant filter from frozen conditions.
+
+    The returned Filter is shared between callers and must not be mutated.
+    """
+    return _conditions_to_filter({k: _thaw(v) for k, v in frozen_conditions})
+
+
+def _conditions_to_filter(conditions: dict[str, Any]) -> Filter | None:
+    """Build a Qdrant filter from a conditions dict.
+
+    Args:
+        conditions: Filter conditions
+
+    Returns:
+        Qdrant Filter object, or None if no condition applies
+    """
+    must_conditions = []
+
+    for key, value in conditions.items():
+        if key == "__text_match":
+            # Split into words and create AND conditions for each word
+            # This ensures all words must be present (AND logic)
+            # Lowercase for case-insensitive matching
+            words = value.lower().split()
+            for word in words:
+                word = word.strip()
+                if word:
+                    must_conditions.append(
+                        FieldCondition(key="content", match=MatchText(text=word))
+                    )
+        elif isinstance(value, dict):
+            if "gte" in value or "lte" in value or "gt" in value or "lt" in value:
+                # Detect if values are datetime strings (ISO format)
+                sample = next((v for v in value.values() if v is not None), None)
+                is_datetime = isinstance(sample, str) and ("T" in sample or len(sample) == 10)
+                if is_datetime:
+                    must_conditions.append(
+                        FieldCondition(
+                            key=key,
+                            range=DatetimeRange(
+                                gte=value.get("gte"),
+                                lte=value.get("lte"),
+                                gt=value.get("gt"),
+                                lt=value.get("lt"),
+                            ),
+                        )
+                    )
+                else:
+                    must_conditions.append(
+                        FieldCondition(
+                            key=key,
+                            range=Range(
+                                gte=value.get("gte"),
+                                lte=value.get("lte"),
+                                gt=value.get("gt"),
+                                lt=value.get("lt"),
+                            ),
+                        )
+                    )
+        elif isinstance(value, list):
+            must_conditions.append(
+                FieldCondition(key=key, match=MatchAny(any=value))
+            )
+        else:
+            must_conditions.append(
+                FieldCondition(key=key, match=MatchValue(value=value))
+            )
+
+    if not must_conditions:
+        return None
+
+    return Filter(must=must_conditions)
@@ -1,28 +1,22 @@
 """Search memory tool implementation."""
 
 from datetime import datetime
-from typing import Any
+from typing import Annotated
+
+from pydantic import BeforeValidator, TypeAdapter
 
 from mcp_memoria.core.memory_manager import MemoryManager
 from mcp_memoria.core.memory_types import RecallResult
 
-
-def _parse_date(value: str | datetime | None) -> datetime | None:
-    """Safely parse date from string or datetime.
-
-    Args:
-        value: Date value (string, datetime, or None)
-
-    Returns:
-        datetime or None
-    """
-    if value is None:
-        return None
-    if isinstance(value, datetime):
-        return value
-    if isinstance(value, str):
-        return datetime.fromisoformat(value)
-    return None
+# Parses strings with datetime.fromisoformat (so compact dates like
+# "20240115" work and epoch strings are rejected) and passes datetimes through
+_optional_datetime: TypeAdapter[datetime | None] = TypeAdapter(
+    Annotated[
+        datetime,
+        BeforeValidator(lambda v: datetime.fromisoformat(v) if isinstance(v, str) else v),
+    ]
+    | None
+)
 
 
 class SearchMemoryTool:
@@ -39,8 +33,8 @@ class SearchMemoryTool:
         query: str | None = None,
         memory_type: str | None = None,
         tags: list[str] | None = None,
-        date_from: str | None = None,
-        date_to: str | None = None,
+        date_from: str | datetime | None = None,
+        date_to: str | datetime | None = None,
         importance_min: float | None = None,
         project: str | None = None,
         limit: int = 10,
@@ -63,16 +57,16 @@ class SearchMemoryTool:
 
         Returns:
             List of RecallResults
-        """
-        parsed_date_from = _parse_date(date_from)
-        parsed_date_to = _parse_date(date_to)
 
+        Raises:
+            pydantic.ValidationError: If a date is not a valid ISO datetime
+        """
         return await self.memory_manager.search(
             query=query,
             memory_type=memory_type,
             tags=tags,
-            date_from=parsed_date_from,
-            date_to=parsed_date_to,
+            date_from=_optional_datetime.validate_python(date_from),
+            date_to=_optional_datetime.validate_python(date_to),
             importance_min=importance_min,
             project=project,
             limit=limit,
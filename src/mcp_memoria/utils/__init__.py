@@ -1,5 +1,6 @@
 """Utility functions for MCP Memoria."""
 
 from mcp_memoria.utils.datetime_utils import parse_datetime
+from mcp_memoria.utils.similarity import cosine_topk
 
-__all__ = ["parse_datetime"]
+__all__ = ["cosine_topk", "parse_datetime"]
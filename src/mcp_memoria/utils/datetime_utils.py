@@ -4,6 +4,16 @@ import re
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
+# Formats tried when datetime.fromisoformat() rejects a string
+_FALLBACK_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S.%f",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d",
+)
+# Shortest prefix any of the fallback formats can match
+_DATE_PREFIX_RE = re.compile(r"\d{4}-\d{1,2}-\d{1,2}")
+
 
 def parse_datetime(value: Any, field_name: str = "unknown") -> datetime:
     """Parse datetime from various formats safely.
@@ -25,13 +35,12 @@ def parse_datetime(value: Any, field_name: str = "unknown") -> datetime:
         try:
             return datetime.fromisoformat(value)
         except ValueError:
+            # Every fallback format starts with a date; skip the strptime
+            # attempts (and their exceptions) for strings that can't match
+            if not _DATE_PREFIX_RE.match(value):
+                return datetime.now()
             # Try common formats
-            for fmt in [
-                "%Y-%m-%dT%H:%M:%S.%f",
-                "%Y-%m-%dT%H:%M:%S",
-                "%Y-%m-%d %H:%M:%S",
-                "%Y-%m-%d",
-            ]:
+            for fmt in _FALLBACK_FORMATS:
                 try:
                     return datetime.strptime(value, fmt)
                 except ValueError:
@@ -0,0 +1,59 @@
+"""Vector similarity helpers for in-process rescoring."""
+
+import numpy as np
+
+
+def normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    """L2-normalize each row of a 2-D array.
+
+    Args:
+        vectors: Array of shape (N, D)
+
+    Returns:
+        Contiguous float32 array of unit-length rows (zero rows stay zero)
+    """
+    matrix = np.ascontiguousarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def cosine_topk(
+    queries: np.ndarray,
+    candidates: np.ndarray,
+    k: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Find the k most cosine-similar candidates for each query.
+
+    Similarities for the whole block are computed with a single matrix
+    product, which numpy dispatches to a SIMD-vectorized BLAS kernel.
+
+    Args:
+        queries: Array of shape (Q, D) or (D,)
+        candidates: Array of shape (N, D)
+        k: Number of neighbors per query
+
+    Returns:
+        Tuple of (indices, scores), each of shape (Q, min(k, N)), sorted by
+        descending score. A 1-D query yields 1-D arrays.
+    """
+    single = np.ndim(queries) == 1
+    q = normalize_rows(np.atleast_2d(queries))
+    c = normalize_rows(candidates)
+
+    scores = q @ c.T
+    k = min(k, c.shape[0])
+    if k == 0:
+        indices = np.empty((q.shape[0], 0), dtype=np.intp)
+        top_scores = np.empty((q.shape[0], 0), dtype=np.float32)
+    else:
+        # Partial selection, then sort only the k survivors
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        top_scores = np.take_along_axis(scores, top, axis=1)
+        order = np.argsort(-top_scores, axis=1)
+        indices = np.take_along_axis(top, order, axis=1)
+        top_scores = np.take_along_axis(top_scores, order, axis=1)
+
+    if single:
+        return indices[0], top_scores[0]
+    return indices, top_scores
@@ -6,8 +6,12 @@ Supports multiple parallel work sessions with hybrid disambiguation.
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
+from operator import itemgetter
 from typing import Any
 from uuid import UUID
 
@@ -16,6 +20,7 @@ from mcp_memoria.db import (
     ClientRepository,
     Database,
     ProjectRepository,
+    QueryError,
     WorkSessionRepository,
 )
 from mcp_memoria.db.models import (
@@ -26,6 +31,40 @@ from mcp_memoria.db.models import (
 
 logger = logging.getLogger(__name__)
 
+# Number of sessions listed individually in a report
+RECENT_SESSIONS_LIMIT = 15
+
+# Seconds a resolved client/project name -> ID mapping is reused
+NAME_CACHE_TTL = 300.0
+
+_CATEGORIES = {c.value: c for c in SessionCategory}
+
+
+def _midnight(dt: datetime) -> datetime:
+    """Return dt truncated to the start of its day."""
+    return dt.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+# Report period name -> start of the period relative to now
+PERIOD_STARTS: dict[str, Callable[[datetime], datetime]] = {
+    "today": _midnight,
+    "week": lambda now: _midnight(now - timedelta(days=7)),
+    "month": lambda now: _midnight(now.replace(day=1)),
+    "year": lambda now: _midnight(now.replace(month=1, day=1)),
+}
+
+
+def _parse_category(value: str) -> SessionCategory:
+    """Look up a SessionCategory by value.
+
+    Raises:
+        ValueError: If value is not a valid category (as SessionCategory(value))
+    """
+    try:
+        return _CATEGORIES[value]
+    except KeyError:
+        raise ValueError(f"{value!r} is not a valid SessionCategory") from None
+
 
 class WorkTracker:
     """High-level work tracking operations.
@@ -44,6 +83,8 @@ class WorkTracker:
         _settings = settings or get_settings()
         self._max_parallel = _settings.work_max_parallel_sessions
         self._warning_hours = _settings.work_session_warning_hours
+        # (kind, name) -> (id, monotonic time cached) for clients and projects
+        self._name_cache: dict[tuple[str, str], tuple[UUID, float]] = {}
 
     # ── Public methods ──────────────────────────────────────────────
 
@@ -74,38 +115,33 @@ class WorkTracker:
                 "active_sessions": self._format_session_list(all_active),
             }
 
-        # Resolve or create client
-        client_id = None
-        if client:
-            client_obj = await self._clients.get_by_name(client)
-            if not client_obj:
-                client_obj = await self._clients.create(name=client)
-                logger.info(f"Created new client: {client}")
-            client_id = client_obj.id
-
-        # Resolve or create project
-        project_id = None
-        if project:
-            project_obj = await self._projects.get_by_name(project)
-            if not project_obj:
-                project_obj = await self._projects.create(
-                    name=project,
-                    client_id=client_id,
-                )
-                logger.info(f"Created new project: {project}")
-            project_id = project_obj.id
+        # Resolve or create client and project
+        used_cache = self._has_cached_ids(client, project)
+        client_id, project_id = await self._resolve_start_ids(client, project)
 
         # Create session
-        session_category = SessionCategory(category) if category else SessionCategory.CODING
-        session = await self._sessions.create(
-            description=description,
-            category=session_category,
-            client_id=client_id,
-            project_id=project_id,
-            issue_number=issue_number,
-            pr_number=pr_number,
-            branch=branch,
-        )
+        session_category = _parse_category(category) if category else SessionCategory.CODING
+        fields: dict[str, Any] = {
+            "description": description,
+            "category": session_category,
+            "issue_number": issue_number,
+            "pr_number": pr_number,
+            "branch": branch,
+        }
+        try:
+            session = await self._sessions.create(
+                client_id=client_id, project_id=project_id, **fields
+            )
+        except QueryError:
+            # A cached ID may belong to a client/project deleted since; drop
+            # the cached names and retry once with fresh lookups
+            if not used_cache:
+                raise
+            self._evict_names(client, project)
+            client_id, project_id = await self._resolve_start_ids(client, project)
+            session = await self._sessions.create(
+                client_id=client_id, project_id=project_id, **fields
+            )
 
         # Compute warnings for all active sessions (including newly created)
         all_active = await self._sessions.get_all_active()
@@ -170,7 +206,8 @@ class WorkTracker:
         Returns a unified response with a `sessions` array and legacy
         top-level fields when exactly 1 session is active (backwards compat).
         """
-        all_active = await self._sessions.get_all_active()
+        rows = await self._sessions.get_all_active_with_names()
+        all_active = [session for session, _, _ in rows]
         warnings = self._compute_warnings(all_active)
 
         if not all_active:
@@ -179,32 +216,19 @@ class WorkTracker:
                 result["warnings"] = warnings
             return result
 
-        # Enrich each session with client/project names
+        # Client/project names come joined with the sessions
+        now = datetime.now(UTC)
         sessions_out = []
-        for session in all_active:
-            client_name = None
-            project_name = None
-            if session.client_id:
-                try:
-                    client_obj = await self._clients.get(session.client_id)
-                    client_name = client_obj.name
-                except Exception:
-                    pass
-            if session.project_id:
-                try:
-                    project_obj = await self._projects.get(session.project_id)
-                    project_name = project_obj.name
-                except Exception:
-                    pass
-
+        for session, client_name, project_name in rows:
+            elapsed = self._calculate_elapsed(session, now)
             sessions_out.append({
                 "session_id": str(session.id),
                 "description": session.description,
                 "category": session.category.value,
                 "status": session.status.value,
                 "started_at": session.start_time.isoformat(),
-                "elapsed_minutes": self._calculate_elapsed(session),
-                "elapsed_formatted": self._format_duration(self._calculate_elapsed(session)),
+                "elapsed_minutes": elapsed,
+                "elapsed_formatted": self._format_duration(elapsed),
                 "client": client_name,
                 "project": project_name,
                 "issue": session.issue_number,
@@ -263,12 +287,16 @@ class WorkTracker:
 
         session = session_or_error
         paused = await self._sessions.pause(session.id, reason=reason)
+        # Report the pause start the repository recorded, not a second clock read
+        paused_at = (
+            paused.pauses[-1].start.astimezone(UTC) if paused.pauses else datetime.now(UTC)
+        )
 
         return {
             "session_id": str(paused.id),
             "description": paused.description,
             "status": "paused",
-            "paused_at": datetime.now(UTC).isoformat(),
+            "paused_at": paused_at.isoformat(),
             "reason": reason,
             "elapsed_minutes": self._calculate_elapsed(paused),
         }
@@ -287,12 +315,18 @@ class WorkTracker:
 
         session = session_or_error
         resumed = await self._sessions.resume(session.id)
+        last_pause = resumed.pauses[-1] if resumed.pauses else None
+        resumed_at = (
+            last_pause.end.astimezone(UTC)
+            if last_pause and last_pause.end
+            else datetime.now(UTC)
+        )
 
         return {
             "session_id": str(resumed.id),
             "description": resumed.description,
             "status": "active",
-            "resumed_at": datetime.now(UTC).isoformat(),
+            "resumed_at": resumed_at.isoformat(),
             "total_pause_minutes": resumed.total_pause_minutes,
         }
 
@@ -346,120 +380,79 @@ class WorkTracker:
         if start_date:
             start = datetime.fromisoformat(start_date)
         else:
-            if period == "today":
-                start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-            elif period == "week":
-                start = now - timedelta(days=7)
-                start = start.replace(hour=0, minute=0, second=0, microsecond=0)
-            elif period == "month":
-                start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-            elif period == "year":
-                start = now.replace(month=1, day=1, hour=0, minute=0, second=0, microsecond=0)
-            else:  # all
-                start = None
+            period_start = PERIOD_STARTS.get(period)  # None for "all"
+            start = period_start(now) if period_start else None
 
         end = datetime.fromisoformat(end_date) if end_date else now
 
         # Resolve client/project IDs
-        client_id = None
-        project_id = None
-        if client:
-            client_obj = await self._clients.get_by_name(client)
-            if client_obj:
-                client_id = client_obj.id
-        if project:
-            project_obj = await self._projects.get_by_name(project)
-            if project_obj:
-                project_id = project_obj.id
-
-        session_category = SessionCategory(category) if category else None
-
-        # Get sessions
-        sessions = await self._sessions.list(
-            client_id=client_id,
-            project_id=project_id,
-            status=SessionStatus.COMPLETED,
-            category=session_category,
-            start_after=start,
-            start_before=end,
-            limit=1000,
-        )
+        client_id = await self._resolve_client_id(client) if client else None
+        project_id = await self._resolve_project_id(project) if project else None
+
+        session_category = _parse_category(category) if category else None
+
+        filters: dict[str, Any] = {
+            "client_id": client_id,
+            "project_id": project_id,
+            "status": SessionStatus.COMPLETED,
+            "category": session_category,
+            "start_after": start,
+            "start_before": end,
+        }
 
-        # Calculate totals
-        total_minutes = sum(self._calculate_duration(s) for s in sessions)
+        # Totals (and the breakdown) are summed by the database; only the most
+        # recent sessions are fetched as rows, with names joined in. The two
+        # queries are independent, so they run concurrently on the pool.
+        groups, recent_rows = await asyncio.gather(
+            self._sessions.aggregate(group_by=group_by, **filters),
+            self._sessions.list_recent_with_names(limit=RECENT_SESSIONS_LIMIT, **filters),
+        )
+        total_minutes = sum(minutes for _, minutes, _ in groups)
+        total_sessions = sum(count for _, _, count in groups)
         total_hours = round(total_minutes / 60, 2)
 
+        # Resolve breakdown group names, one query for all groups
+        clients_map: dict[UUID, Any] = {}
+        projects_map: dict[UUID, Any] = {}
+        if group_by == "client":
+            clients_map = await self._clients.get_many(UUID(key) for key, _, _ in groups if key)
+        elif group_by == "project":
+            projects_map = await self._projects.get_many(UUID(key) for key, _, _ in groups if key)
+
         # Build breakdown
         breakdown = []
         if group_by:
-            groups: dict[str, list[WorkSession]] = {}
-            for s in sessions:
-                if group_by == "client" and s.client_id:
-                    key = str(s.client_id)
-                elif group_by == "project" and s.project_id:
-                    key = str(s.project_id)
-                elif group_by == "category":
-                    key = s.category.value
-                else:
-                    key = "other"
-
-                if key not in groups:
-                    groups[key] = []
-                groups[key].append(s)
-
-            # Resolve names and calculate totals
-            for key, group_sessions in groups.items():
-                group_minutes = sum(self._calculate_duration(s) for s in group_sessions)
-                group_name = key
+            for key, group_minutes, group_count in groups:
+                group_name = key or "other"
 
                 if group_by == "client":
-                    try:
-                        c = await self._clients.get(UUID(key))
-                        group_name = c.name
-                    except Exception:
-                        group_name = "Unknown"
+                    c = clients_map.get(UUID(key)) if key else None
+                    group_name = c.name if c else "Unknown"
                 elif group_by == "project":
-                    try:
-                        p = await self._projects.get(UUID(key))
-                        group_name = p.name
-                    except Exception:
-                        group_name = "Unknown"
+                    p = projects_map.get(UUID(key)) if key else None
+                    group_name = p.name if p else "Unknown"
 
                 breakdown.append({
                     "group": group_name,
                     "hours": round(group_minutes / 60, 2),
-                    "sessions": len(group_sessions),
+                    "sessions": group_count,
                     "percentage": round((group_minutes / total_minutes * 100) if total_minutes > 0 else 0, 1),
                 })
 
-            breakdown.sort(key=lambda x: x["hours"], reverse=True)
+            breakdown.sort(key=itemgetter("hours"), reverse=True)
 
-        # Recent sessions (all, limited in server output)
-        recent = []
-        for s in sessions:
-            client_name = None
-            project_name = None
-            if s.client_id:
-                try:
-                    c = await self._clients.get(s.client_id)
-                    client_name = c.name
-                except Exception:
-                    pass
-            if s.project_id:
-                try:
-                    p = await self._projects.get(s.project_id)
-                    project_name = p.name
-                except Exception:
-                    pass
-
-            recent.append({
+        # Recent sessions, newest first
+        recent = [
+            {
                 "date": s.start_time.date().isoformat(),
                 "description": s.description,
-                "duration_minutes": self._calculate_duration(s),
+                "duration_minutes": self._calculate_duration(s, now),
                 "category": s.category.value,
                 "client": client_name,
                 "project": project_name,
-            })
+            }
+            for s, client_name, project_name in recent_rows
+        ]
 
         return {
             "period": period,
@@ -467,13 +460,101 @@ class WorkTracker:
             "end_date": end.isoformat(),
             "total_hours": total_hours,
             "total_minutes": total_minutes,
-            "total_sessions": len(sessions),
+            "total_sessions": total_sessions,
             "breakdown": breakdown,
             "recent_sessions": recent,
         }
 
     # ── Private helpers ─────────────────────────────────────────────
 
+    async def _resolve_client_id(self, name: str, create: bool = False) -> UUID | None:
+        """Look up a client ID by name, optionally creating the client.
+
+        Resolved IDs are cached for NAME_CACHE_TTL seconds, so repeated
+        starts and reports for the same client skip the lookup query.
+        """
+        client_id = self._cached_id("client", name)
+        if client_id:
+            return client_id
+
+        if create:
+            client_id, created = await self._clients.get_or_create_by_name(name)
+            if created:
+                logger.info(f"Created new client: {name}")
+        else:
+            client_obj = await self._clients.get_by_name(name)
+            if not client_obj:
+                return None
+            client_id = client_obj.id
+        self._name_cache[("client", name)] = (client_id, time.monotonic())
+        return client_id
+
+    async def _resolve_project_id(
+        self,
+        name: str,
+        client_id: UUID | None = None,
+        create: bool = False,
+    ) -> UUID | None:
+        """Look up a project ID by name, optionally creating the project.
+
+        New projects are created under client_id. Resolved IDs are cached
+        like client IDs.
+        """
+        project_id = self._cached_id("project", name)
+        if project_id:
+            return project_id
+
+        if create:
+            project_id, created = await self._projects.get_or_create_by_name(
+                name, client_id=client_id
+            )
+            if created:
+                logger.info(f"Created new project: {name}")
+        else:
+            project_obj = await self._projects.get_by_name(name)
+            if not project_obj:
+                return None
+            project_id = project_obj.id
+        self._name_cache[("project", name)] = (project_id, time.monotonic())
+        return project_id
+
+    async def _resolve_start_ids(
+        self, client: str | None, project: str | None
+    ) -> tuple[UUID | None, UUID | None]:
+        """Resolve (creating if needed) the client and project for start()."""
+        client_id = await self._resolve_client_id(client, create=True) if client else None
+        project_id = (
+            await self._resolve_project_id(project, client_id=client_id, create=True)
+            if project
+            else None
+        )
+        return client_id, project_id
+
+    def _has_cached_ids(self, client: str | None, project: str | None) -> bool:
+        """Return True if an unexpired ID is cached for either name."""
+        return bool(
+            (client and self._cached_id("client", client))
+            or (project and self._cached_id("project", project))
+        )
+
+    def _evict_names(self, client: str | None, project: str | None) -> None:
+        """Drop any cached IDs for the given client and project names."""
+        if client:
+            self._name_cache.pop(("client", client), None)
+        if project:
+            self._name_cache.pop(("project", project), None)
+
+    def _cached_id(self, kind: str, name: str) -> UUID | None:
+        """Return a cached client/project ID if it has not expired."""
+        entry = self._name_cache.get((kind, name))
+        if entry is None:
+            return None
+        entity_id, cached_at = entry
+        if time.monotonic() - cached_at >= NAME_CACHE_TTL:
+            del self._name_cache[(kind, name)]
+            return None
+        return entity_id
+
     async def _resolve_session(
         self,
         session_id: str | None,
@@ -524,13 +605,14 @@ class WorkTracker:
 
     def _format_session_list(self, sessions: list[WorkSession]) -> list[dict[str, Any]]:
         """Format a list of sessions for disambiguation payloads."""
+        now = datetime.now(UTC)
         return [
             {
                 "session_id": str(s.id),
                 "description": s.description,
                 "status": s.status.value,
                 "started_at": s.start_time.isoformat(),
-                "elapsed_minutes": self._calculate_elapsed(s),
+                "elapsed_minutes": self._calculate_elapsed(s, now),
             }
             for s in sessions
         ]
@@ -580,22 +662,23 @@ class WorkTracker:
 
         return warnings
 
-    def _calculate_elapsed(self, session: WorkSession) -> int:
-        """Calculate elapsed minutes for an active/paused session."""
-        if session.end_time:
-            total = int((session.end_time - session.start_time).total_seconds() / 60)
-        else:
-            total = int((datetime.now(UTC) - session.start_time).total_seconds() / 60)
+    def _calculate_elapsed(self, session: WorkSession, now: datetime | None = None) -> int:
+        """Calculate elapsed minutes for an active/paused session.
+
+        Callers formatting many sessions pass a single `now` captured once.
+        """
+        end = session.end_time or now or datetime.now(UTC)
+        total = int((end - session.start_time).total_seconds() / 60)
         return total - session.total_pause_minutes
 
-    def _calculate_duration(self, session: WorkSession) -> int:
+    def _calculate_duration(self, session: WorkSession, now: datetime | None = None) -> int:
         """Calculate work duration for a completed session."""
         if session.duration_minutes is not None:
             return session.duration_minutes
         if session.end_time:
             total = int((session.end_time - session.start_time).total_seconds() / 60)
             return total - session.total_pause_minutes
-        return self._calculate_elapsed(session)
+        return self._calculate_elapsed(session, now)
 
     def _format_duration(self, minutes: int) -> str:
         """Format duration as human-readable string."""
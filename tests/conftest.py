@@ -0,0 +1,17 @@
+"""Shared pytest configuration."""
+
+import pytest
+
+try:
+    import uvloop
+except ImportError:  # not installed, or unsupported platform (Windows)
+    uvloop = None
+
+
+if uvloop is not None:
+
+    def pytest_asyncio_loop_factories(
+        config: pytest.Config, item: pytest.Item
+    ) -> dict[str, object]:
+        """Run async tests on uvloop when it is available."""
+        return {"uvloop": uvloop.new_event_loop}
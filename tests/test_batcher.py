@@ -0,0 +1,126 @@
+"""Tests for EmbeddingBatcher request coalescing."""
+
+import asyncio
+
+import pytest
+
+from mcp_memoria.embeddings.batcher import EmbeddingBatcher
+from mcp_memoria.embeddings.ollama_client import EmbeddingResult
+
+
+def make_result(text: str) -> EmbeddingResult:
+    """Build a result whose embedding identifies the text it came from."""
+    return EmbeddingResult(
+        embedding=[float(len(text))], model="test-model", dimensions=1, cached=False
+    )
+
+
+class RecordingEmbedder:
+    """Fake embedder recording its calls; single embeds block on ``gate``."""
+
+    def __init__(self):
+        self.direct: list[tuple[str, str]] = []
+        self.batches: list[tuple[list[str], str]] = []
+        self.gate = asyncio.Event()
+        self.gate.set()
+        self.error: Exception | None = None
+        self.short_by = 0
+
+    async def embed(self, text, text_type="document", use_cache=True):
+        self.direct.append((text, text_type))
+        await self.gate.wait()
+        return make_result(text)
+
+    async def embed_batch(self, texts, text_type="document", use_cache=True):
+        self.batches.append((list(texts), text_type))
+        if self.error is not None:
+            raise self.error
+        return [make_result(t) for t in texts][self.short_by :]
+
+
+@pytest.fixture
+def embedder():
+    return RecordingEmbedder()
+
+
+@pytest.fixture
+async def busy_batcher(embedder):
+    """Batcher with a single-text call in flight, so new requests get queued."""
+    batcher = EmbeddingBatcher(embedder, max_batch_size=4, window=0.05)
+    embedder.gate.clear()
+    blocker = asyncio.create_task(batcher.embed("blocker"))
+    await asyncio.sleep(0)
+    yield batcher
+    embedder.gate.set()
+    await blocker
+
+
+class TestEmbeddingBatcher:
+    async def test_idle_request_skips_window(self, embedder):
+        batcher = EmbeddingBatcher(embedder, window=10.0)
+
+        result = await asyncio.wait_for(batcher.embed("alone"), timeout=1.0)
+
+        assert result.embedding == [5.0]
+        assert embedder.direct == [("alone", "document")]
+        assert embedder.batches == []
+
+    async def test_window_flush_coalesces_requests(self, busy_batcher, embedder):
+        tasks = [asyncio.create_task(busy_batcher.embed(t)) for t in ("a", "bb", "ccc")]
+        await asyncio.sleep(0)
+        assert embedder.batches == []
+
+        results = await asyncio.gather(*tasks)
+
+        assert embedder.batches == [(["a", "bb", "ccc"], "document")]
+        assert [r.embedding for r in results] == [[1.0], [2.0], [3.0]]
+
+    async def test_max_batch_size_flushes_early(self, embedder):
+        batcher = EmbeddingBatcher(embedder, max_batch_size=2, window=10.0)
+        embedder.gate.clear()
+        blocker = asyncio.create_task(batcher.embed("blocker"))
+        await asyncio.sleep(0)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(batcher.embed("a"), batcher.embed("bb")), timeout=1.0
+        )
+
+        assert embedder.batches == [(["a", "bb"], "document")]
+        assert [r.embedding for r in results] == [[1.0], [2.0]]
+        embedder.gate.set()
+        await blocker
+
+    async def test_groups_by_text_type(self, busy_batcher, embedder):
+        results = await asyncio.gather(
+            busy_batcher.embed("q1", text_type="query"),
+            busy_batcher.embed("doc", text_type="document"),
+            busy_batcher.embed("q22", text_type="query"),
+        )
+
+        assert sorted(embedder.batches, key=lambda b: b[1]) == [
+            (["doc"], "document"),
+            (["q1", "q22"], "query"),
+        ]
+        assert [r.embedding for r in results] == [[2.0], [3.0], [3.0]]
+
+    async def test_error_propagates_to_all_waiters(self, busy_batcher, embedder):
+        embedder.error = RuntimeError("ollama down")
+
+        results = await asyncio.gather(
+            busy_batcher.embed("a"), busy_batcher.embed("b"), return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert all(str(r) == "ollama down" for r in results)
+
+    async def test_result_count_mismatch_fails_all_waiters(self, busy_batcher, embedder):
+        embedder.short_by = 1
+
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                busy_batcher.embed("a"), busy_batcher.embed("b"), return_exceptions=True
+            ),
+            timeout=1.0,
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
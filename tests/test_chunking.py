@@ -90,7 +90,8 @@ class TestChunkForEmbedding:
     def test_chunk_for_embedding(self):
         """Test chunking for embedding with context limit."""
         text = "Sample text. " * 100
-        chunks = chunk_for_embedding(text, max_context=512)
+        chunks = list(chunk_for_embedding(text, max_context=512))
+        assert chunks
 
         # All chunks should be under the context limit
         for chunk in chunks:
@@ -1,58 +1,126 @@
 """Integration tests for chunking + full-text search features."""
 
 import asyncio
-from unittest.mock import AsyncMock, MagicMock, patch
+import functools
+import hashlib
 
+import numpy as np
 import pytest
 
 from mcp_memoria.config.settings import Settings
+from mcp_memoria.core.consolidation import MemoryConsolidator
 from mcp_memoria.core.memory_manager import MemoryManager
 from mcp_memoria.core.memory_types import MemoryItem, MemoryType
+from mcp_memoria.core.working_memory import WorkingMemory
+from mcp_memoria.embeddings.batcher import EmbeddingBatcher
+from mcp_memoria.embeddings.chunking import ChunkingConfig, TextChunker
 from mcp_memoria.embeddings.ollama_client import EmbeddingResult
+from mcp_memoria.storage.backup import MemoryBackup
+from mcp_memoria.storage.collections import CollectionManager
+from mcp_memoria.storage.qdrant_store import QdrantStore
+
+
+# Long contents, each well over the test chunk_size of 100
+TESTING_CONTENT = "This is a sentence for testing purposes. " * 10  # ~410 chars
+ML_CONTENT = "Unique content about machine learning and neural networks. " * 10
+PYTHON_CONTENT = "Full original content about Python programming. " * 10
+DELETE_CONTENT = "Content to be deleted soon. " * 10
+ORIGINAL_CONTENT = "Original long content for update test. " * 10
+RECHUNK_CONTENT = "Completely new and different content for rechunking. " * 8
+METADATA_CONTENT = "Metadata update test content. " * 10
+GET_CONTENT = "Memory that will be chunked for get test. " * 10
+CONSOLIDATION_CONTENT = "Consolidation test content that repeats. " * 10
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_embedding(dim: int, seed: float) -> tuple[float, ...]:
+    """Build (once per dim/seed) the deterministic fake embedding."""
+    digest = hashlib.md5(str(seed).encode()).digest()
+    base = np.frombuffer(digest, dtype=np.uint8) / 255.0
+    # Repeat to fill dimensions
+    return tuple(np.tile(base, dim // base.size + 1)[:dim].tolist())
 
 
 def make_embedding(dim: int = 768, seed: float = 0.1) -> list[float]:
     """Create a deterministic fake embedding vector."""
-    import hashlib
+    return list(_cached_embedding(dim, seed))
 
-    h = hashlib.md5(str(seed).encode()).hexdigest()
-    base = [int(h[i : i + 2], 16) / 255.0 for i in range(0, 32, 2)]
-    # Repeat to fill dimensions
-    return (base * (dim // len(base) + 1))[:dim]
-
-
-def make_embedder_mock():
-    """Create a mock embedder that returns deterministic embeddings."""
-    embedder = AsyncMock()
-    call_count = 0
-
-    async def embed_side_effect(text, text_type="document", use_cache=True):
-        nonlocal call_count
-        call_count += 1
-        return EmbeddingResult(
-            embedding=make_embedding(seed=hash(text) % 1000 / 1000.0),
-            model="test-model",
-            dimensions=768,
-            cached=False,
-        )
 
-    embedder.embed = AsyncMock(side_effect=embed_side_effect)
-    embedder.embed_batch = AsyncMock(side_effect=lambda texts, **kw: asyncio.gather(
-        *[embed_side_effect(t) for t in texts]
-    ))
-    embedder.check_connection = AsyncMock(return_value=True)
-    embedder.ensure_model = AsyncMock(return_value=True)
-    embedder.get_model_info = MagicMock(return_value={
-        "model": "test-model",
-        "host": "http://localhost:11434",
-        "dimensions": 768,
-    })
-    return embedder
+@functools.lru_cache(maxsize=1024)
+def fake_embedding_result(text: str) -> EmbeddingResult:
+    """Deterministic embedding result derived from the text.
+
+    Memoized: the tests chunk the same contents over and over, and nothing
+    mutates the returned results.
+    """
+    return EmbeddingResult(
+        embedding=make_embedding(seed=hash(text) % 1000 / 1000.0),
+        model="test-model",
+        dimensions=768,
+        cached=False,
+    )
+
+
+class FakeEmbedder:
+    """Minimal stand-in for OllamaEmbedder returning deterministic embeddings.
+
+    Plain coroutines instead of AsyncMock keep mock bookkeeping out of every
+    embedding call; wrap a method in AsyncMock only where a test needs to
+    assert on its calls.
+    """
+
+    async def embed(self, text, text_type="document", use_cache=True):
+        return fake_embedding_result(text)
+
+    async def embed_batch(self, texts, **kw):
+        return [fake_embedding_result(t) for t in texts]
+
+    async def check_connection(self):
+        return True
+
+    async def ensure_model(self):
+        return True
+
+    def get_model_info(self):
+        return {
+            "model": "test-model",
+            "host": "http://localhost:11434",
+            "dimensions": 768,
+        }
+
+
+def build_manager(**components) -> MemoryManager:
+    """Create a MemoryManager from ready-made components, skipping __init__."""
+    mgr = MemoryManager.__new__(MemoryManager)
+    mgr.__dict__.update(components)
+    return mgr
+
+
+async def chunk_points(mgr: MemoryManager, collection: str, parent_id: str) -> list:
+    """Fetch every stored point belonging to a logical memory."""
+    points, _ = await mgr.vector_store.scroll(
+        collection=collection,
+        limit=100,
+        filter_conditions={"parent_id": parent_id},
+    )
+    return points
+
+
+@pytest.fixture(scope="module")
+def embedder():
+    """Fake embedder shared by the module's tests (it holds no per-test state)."""
+    return FakeEmbedder()
+
+
+@pytest.fixture(scope="module")
+def shared_store():
+    """In-memory Qdrant store reused by the module's tests."""
+    return QdrantStore()
 
 
 @pytest.fixture
-def manager(tmp_path):
-    """Create a MemoryManager with in-memory Qdrant and mock embedder."""
+def manager(tmp_path, embedder, shared_store):
+    """Create a MemoryManager with in-memory Qdrant and fake embedder."""
     settings = Settings(
         qdrant_path=tmp_path / "qdrant",
         cache_path=tmp_path / "cache",
@@ -60,33 +128,24 @@ def manager(tmp_path):
         chunk_overlap=20,
     )
 
-    mgr = MemoryManager.__new__(MemoryManager)
-    mgr.settings = settings
-
-    # Init storage with in-memory Qdrant
-    from mcp_memoria.storage.qdrant_store import QdrantStore
-    from mcp_memoria.storage.collections import CollectionManager
-    from mcp_memoria.core.consolidation import MemoryConsolidator
-    from mcp_memoria.storage.backup import MemoryBackup
-    from mcp_memoria.core.working_memory import WorkingMemory
-    from mcp_memoria.embeddings.chunking import ChunkingConfig, TextChunker
-
-    mgr.vector_store = QdrantStore()  # in-memory mode
-    mgr.collections = CollectionManager(
-        store=mgr.vector_store,
-        vector_size=768,
-    )
-    mgr.consolidator = MemoryConsolidator(store=mgr.vector_store)
-    mgr.backup = MemoryBackup(store=mgr.vector_store, collection_manager=mgr.collections)
-    mgr.embedder = make_embedder_mock()
-    mgr.cache = None
-    mgr.working_memory = WorkingMemory(max_size=100, default_ttl=3600)
-    mgr.chunker = TextChunker(
-        ChunkingConfig(chunk_size=100, chunk_overlap=20)
+    # Start every test from empty collections
+    for memory_type in MemoryType:
+        shared_store.delete_collection(memory_type.value)
+
+    collections = CollectionManager(store=shared_store, vector_size=768)
+    return build_manager(
+        settings=settings,
+        vector_store=shared_store,
+        collections=collections,
+        consolidator=MemoryConsolidator(store=shared_store),
+        backup=MemoryBackup(store=shared_store, collection_manager=collections),
+        embedder=embedder,
+        embedding_batcher=EmbeddingBatcher(embedder),
+        cache=None,
+        working_memory=WorkingMemory(max_size=100, default_ttl=3600),
+        chunker=TextChunker(ChunkingConfig(chunk_size=100, chunk_overlap=20)),
+        _initialized=False,
     )
-    mgr._initialized = False
-
-    return mgr
 
 
 @pytest.fixture
@@ -126,7 +185,7 @@ class TestStoreLongContent:
     @pytest.mark.asyncio
     async def test_store_long_content_chunked(self, initialized_manager):
         mgr = initialized_manager
-        long_content = "This is a sentence for testing purposes. " * 10  # ~410 chars
+        long_content = TESTING_CONTENT
 
         memory = await mgr.store(
             content=long_content,
@@ -140,11 +199,7 @@ class TestStoreLongContent:
         assert len(direct) == 0
 
         # Should have chunk points with parent_id
-        chunk_results, _ = await mgr.vector_store.scroll(
-            collection="semantic",
-            limit=100,
-            filter_conditions={"parent_id": memory.id},
-        )
+        chunk_results = await chunk_points(mgr, "semantic", memory.id)
         assert len(chunk_results) >= 2
 
         # Verify chunk payload structure
@@ -165,7 +220,7 @@ class TestRecallDeduplicatesChunks:
     @pytest.mark.asyncio
     async def test_recall_deduplicates_chunks(self, initialized_manager):
         mgr = initialized_manager
-        long_content = "Unique content about machine learning and neural networks. " * 10
+        long_content = ML_CONTENT
 
         await mgr.store(
             content=long_content,
@@ -183,7 +238,7 @@ class TestRecallReturnsFullContent:
     @pytest.mark.asyncio
     async def test_recall_returns_full_content(self, initialized_manager):
         mgr = initialized_manager
-        long_content = "Full original content about Python programming. " * 10
+        long_content = PYTHON_CONTENT
 
         await mgr.store(content=long_content, memory_type="semantic")
 
@@ -199,17 +254,13 @@ class TestDeleteRemovesAllChunks:
     @pytest.mark.asyncio
     async def test_delete_removes_all_chunks(self, initialized_manager):
         mgr = initialized_manager
-        long_content = "Content to be deleted soon. " * 10
+        long_content = DELETE_CONTENT
 
         memory = await mgr.store(content=long_content, memory_type="episodic")
         memory_id = memory.id
 
         # Verify chunks exist
-        chunks_before, _ = await mgr.vector_store.scroll(
-            collection="episodic",
-            limit=100,
-            filter_conditions={"parent_id": memory_id},
-        )
+        chunks_before = await chunk_points(mgr, "episodic", memory_id)
         assert len(chunks_before) >= 2
 
         # Delete
@@ -217,11 +268,7 @@ class TestDeleteRemovesAllChunks:
         assert deleted >= 1
 
         # Verify all chunks are gone
-        chunks_after, _ = await mgr.vector_store.scroll(
-            collection="episodic",
-            limit=100,
-            filter_conditions={"parent_id": memory_id},
-        )
+        chunks_after = await chunk_points(mgr, "episodic", memory_id)
         assert len(chunks_after) == 0
 
 
@@ -231,22 +278,23 @@ class TestUpdateContentRechunks:
     @pytest.mark.asyncio
     async def test_update_content_rechunks(self, initialized_manager):
         mgr = initialized_manager
-        original = "Original long content for update test. " * 10
+        original = ORIGINAL_CONTENT
 
         memory = await mgr.store(content=original, memory_type="semantic")
         memory_id = memory.id
 
-        # Count original chunks
-        original_chunks, _ = await mgr.vector_store.scroll(
-            collection="semantic",
-            limit=100,
-            filter_conditions={"parent_id": memory_id},
+        # Count original chunks; the read-only checks don't depend on each other
+        original_chunks, stored = await asyncio.gather(
+            chunk_points(mgr, "semantic", memory_id),
+            mgr.get(memory_id, "semantic"),
         )
         original_count = len(original_chunks)
         assert original_count >= 2
+        assert stored is not None
+        assert stored.content == original
 
         # Update with different content
-        new_content = "Completely new and different content for rechunking. " * 8
+        new_content = RECHUNK_CONTENT
         updated = await mgr.update(
             memory_id=memory_id,
             memory_type="semantic",
@@ -256,12 +304,13 @@ class TestUpdateContentRechunks:
         assert updated.content == new_content
 
         # Verify chunks are refreshed
-        new_chunks, _ = await mgr.vector_store.scroll(
-            collection="semantic",
-            limit=100,
-            filter_conditions={"parent_id": memory_id},
+        new_chunks, retrieved = await asyncio.gather(
+            chunk_points(mgr, "semantic", memory_id),
+            mgr.get(memory_id, "semantic"),
         )
         assert len(new_chunks) >= 1
+        assert retrieved is not None
+        assert retrieved.content == new_content
         # All chunks should have the new full_content
         for chunk in new_chunks:
             assert chunk.payload["full_content"] == new_content
@@ -273,7 +322,7 @@ class TestUpdateMetadataUpdatesAllChunks:
     @pytest.mark.asyncio
     async def test_update_metadata_updates_all_chunks(self, initialized_manager):
         mgr = initialized_manager
-        content = "Metadata update test content. " * 10
+        content = METADATA_CONTENT
 
         memory = await mgr.store(
             content=content,
@@ -292,11 +341,7 @@ class TestUpdateMetadataUpdatesAllChunks:
         assert updated is not None
 
         # Verify all chunks have updated metadata
-        chunks, _ = await mgr.vector_store.scroll(
-            collection="procedural",
-            limit=100,
-            filter_conditions={"parent_id": memory.id},
-        )
+        chunks = await chunk_points(mgr, "procedural", memory.id)
         for chunk in chunks:
             assert chunk.payload["tags"] == ["new-tag"]
             assert chunk.payload["importance"] == 0.9
@@ -308,7 +353,7 @@ class TestGetChunkedMemory:
     @pytest.mark.asyncio
     async def test_get_finds_chunked_memory(self, initialized_manager):
         mgr = initialized_manager
-        content = "Memory that will be chunked for get test. " * 10
+        content = GET_CONTENT
 
         memory = await mgr.store(content=content, memory_type="episodic")
 
@@ -395,7 +440,7 @@ class TestConsolidationSkipsSameParentChunks:
         mgr = initialized_manager
 
         # Store a long memory that gets chunked
-        long_content = "Consolidation test content that repeats. " * 10
+        long_content = CONSOLIDATION_CONTENT
         memory = await mgr.store(
             content=long_content,
             memory_type="semantic",
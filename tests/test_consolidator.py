@@ -1,9 +1,10 @@
 """Tests for MemoryConsolidator."""
 
+from collections import Counter
 from datetime import datetime, timedelta
-from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from mcp_memoria.core import consolidation
 from mcp_memoria.core.consolidation import (
     ConsolidationResult,
     MemoryConsolidator,
@@ -11,29 +12,61 @@ from mcp_memoria.core.consolidation import (
 from mcp_memoria.storage.qdrant_store import SearchResult
 
 
+class FakeStore:
+    """In-memory stand-in for QdrantStore with canned results.
+
+    Set the ``*_ret`` attributes to control what each method returns;
+    ``calls`` counts invocations per method name.
+    """
+
+    def __init__(self) -> None:
+        self.scroll_ret: tuple[list[SearchResult], str | None] = ([], None)
+        self.search_ret: list[SearchResult] = []
+        self.get_ret: list[SearchResult] = []
+        self.calls: Counter[str] = Counter()
+
+    async def scroll(self, *args, **kwargs):
+        self.calls["scroll"] += 1
+        return self.scroll_ret
+
+    async def search(self, *args, **kwargs):
+        self.calls["search"] += 1
+        return self.search_ret
+
+    async def get(self, *args, **kwargs):
+        self.calls["get"] += 1
+        return self.get_ret
+
+    async def update_payload(self, *args, **kwargs):
+        self.calls["update_payload"] += 1
+        return True
+
+    async def update_payload_batch(self, collection, updates, merge=True):
+        self.calls["update_payload_batch"] += 1
+        return len(updates)
+
+    async def delete(self, *args, **kwargs):
+        self.calls["delete"] += 1
+        return 0
+
+
 @pytest.fixture
-def mock_store():
-    """Create a mock QdrantStore."""
-    store = MagicMock()
-    store.scroll = AsyncMock(return_value=([], None))
-    store.search = AsyncMock(return_value=[])
-    store.get = AsyncMock(return_value=[])
-    store.update_payload = AsyncMock(return_value=True)
-    store.delete = AsyncMock(return_value=0)
-    return store
+def store():
+    """Create a fake QdrantStore."""
+    return FakeStore()
 
 
 @pytest.fixture
-def consolidator(mock_store):
-    """Create a consolidator with mocked store."""
-    return MemoryConsolidator(store=mock_store)
+def consolidator(store):
+    """Create a consolidator with a fake store."""
+    return MemoryConsolidator(store=store)
 
 
 class TestConsolidate:
     """Tests for consolidate method."""
 
     @pytest.mark.asyncio
-    async def test_consolidate_empty_collection(self, consolidator, mock_store):
+    async def test_consolidate_empty_collection(self, consolidator, store):
         """Test consolidation on empty collection."""
         result = await consolidator.consolidate(
             collection="episodic",
@@ -47,7 +80,7 @@ class TestConsolidate:
         assert result.dry_run is True
 
     @pytest.mark.asyncio
-    async def test_consolidate_no_similar_memories(self, consolidator, mock_store):
+    async def test_consolidate_no_similar_memories(self, consolidator, store):
         """Test consolidation with no similar memories."""
         # Single memory, no similar ones
         memory = SearchResult(
@@ -56,8 +89,8 @@ class TestConsolidate:
             payload={"content": "test", "chunk_index": 0},
             vector=[0.1] * 768,
         )
-        mock_store.scroll.return_value = ([memory], None)
-        mock_store.search.return_value = []  # No similar memories
+        store.scroll_ret = ([memory], None)
+        store.search_ret = []  # No similar memories
 
         result = await consolidator.consolidate(
             collection="episodic",
@@ -68,12 +101,52 @@ class TestConsolidate:
         assert result.merged_count == 0
         assert result.total_processed == 1
 
+    @pytest.mark.asyncio
+    async def test_consolidate_merges_similar_vectors(self, consolidator, store):
+        """Test that near-identical vectors are merged once, without store searches."""
+        mem1 = SearchResult(id="mem1", score=1.0, payload={"content": "a"}, vector=[0.1] * 768)
+        mem2 = SearchResult(id="mem2", score=1.0, payload={"content": "b"}, vector=[0.1] * 768)
+        mem3 = SearchResult(
+            id="mem3", score=1.0, payload={"content": "c"}, vector=[0.1, -0.1] * 384
+        )
+        store.scroll_ret = ([mem1, mem2, mem3], None)
+
+        result = await consolidator.consolidate(
+            collection="episodic",
+            similarity_threshold=0.9,
+            dry_run=True,
+        )
+
+        assert store.calls["search"] == 0
+        assert result.merged_count == 1
+        assert result.total_processed == 3
+
+    @pytest.mark.asyncio
+    async def test_consolidate_scores_across_blocks(self, consolidator, store, monkeypatch):
+        """Test that splitting candidates into scoring blocks finds the same merges."""
+        monkeypatch.setattr(consolidation, "SCORING_BLOCK_SIZE", 1)
+        mem1 = SearchResult(id="mem1", score=1.0, payload={"content": "a"}, vector=[0.1] * 768)
+        mem2 = SearchResult(id="mem2", score=1.0, payload={"content": "b"}, vector=[0.1] * 768)
+        mem3 = SearchResult(
+            id="mem3", score=1.0, payload={"content": "c"}, vector=[0.1, -0.1] * 384
+        )
+        store.scroll_ret = ([mem1, mem2, mem3], None)
+
+        result = await consolidator.consolidate(
+            collection="episodic",
+            similarity_threshold=0.9,
+            dry_run=True,
+        )
+
+        assert result.merged_count == 1
+        assert result.total_processed == 3
+
 
 class TestApplyForgetting:
     """Tests for apply_forgetting method."""
 
     @pytest.mark.asyncio
-    async def test_forgetting_empty_collection(self, consolidator, mock_store):
+    async def test_forgetting_empty_collection(self, consolidator, store):
         """Test forgetting on empty collection."""
         result = await consolidator.apply_forgetting(
             collection="episodic",
@@ -86,7 +159,7 @@ class TestApplyForgetting:
         assert result.dry_run is True
 
     @pytest.mark.asyncio
-    async def test_forgetting_skips_recent_memories(self, consolidator, mock_store):
+    async def test_forgetting_skips_recent_memories(self, consolidator, store):
         """Test that recent memories are not forgotten."""
         recent_memory = SearchResult(
             id="mem1",
@@ -99,7 +172,7 @@ class TestApplyForgetting:
                 "access_count": 0,
             },
         )
-        mock_store.scroll.return_value = ([recent_memory], None)
+        store.scroll_ret = ([recent_memory], None)
 
         result = await consolidator.apply_forgetting(
             collection="episodic",
@@ -111,7 +184,7 @@ class TestApplyForgetting:
         assert result.forgotten_count == 0
 
     @pytest.mark.asyncio
-    async def test_forgetting_targets_old_low_importance(self, consolidator, mock_store):
+    async def test_forgetting_targets_old_low_importance(self, consolidator, store):
         """Test that old, low-importance, unaccessed memories are forgotten."""
         old_date = datetime.now() - timedelta(days=60)
         old_memory = SearchResult(
@@ -126,7 +199,7 @@ class TestApplyForgetting:
                 "access_count": 0,
             },
         )
-        mock_store.scroll.return_value = ([old_memory], None)
+        store.scroll_ret = ([old_memory], None)
 
         result = await consolidator.apply_forgetting(
             collection="episodic",
@@ -142,7 +215,7 @@ class TestBoostOnAccess:
     """Tests for boost_on_access method."""
 
     @pytest.mark.asyncio
-    async def test_boost_increases_importance(self, consolidator, mock_store):
+    async def test_boost_increases_importance(self, consolidator, store):
         """Test that boost increases importance."""
         memory = SearchResult(
             id="mem1",
@@ -153,7 +226,7 @@ class TestBoostOnAccess:
                 "is_chunk": False,
             },
         )
-        mock_store.get.return_value = [memory]
+        store.get_ret = [memory]
 
         new_importance = await consolidator.boost_on_access(
             collection="episodic",
@@ -162,10 +235,10 @@ class TestBoostOnAccess:
         )
 
         assert new_importance == 0.6
-        mock_store.update_payload.assert_called_once()
+        assert store.calls["update_payload"] == 1
 
     @pytest.mark.asyncio
-    async def test_boost_caps_at_max(self, consolidator, mock_store):
+    async def test_boost_caps_at_max(self, consolidator, store):
         """Test that importance is capped at max."""
         memory = SearchResult(
             id="mem1",
@@ -176,7 +249,7 @@ class TestBoostOnAccess:
                 "is_chunk": False,
             },
         )
-        mock_store.get.return_value = [memory]
+        store.get_ret = [memory]
 
         new_importance = await consolidator.boost_on_access(
             collection="episodic",
@@ -188,9 +261,9 @@ class TestBoostOnAccess:
         assert new_importance == 1.0
 
     @pytest.mark.asyncio
-    async def test_boost_missing_memory(self, consolidator, mock_store):
+    async def test_boost_missing_memory(self, consolidator, store):
         """Test boost on non-existent memory."""
-        mock_store.get.return_value = []
+        store.get_ret = []
 
         new_importance = await consolidator.boost_on_access(
             collection="episodic",
@@ -198,20 +271,20 @@ class TestBoostOnAccess:
         )
 
         assert new_importance == 0.0
-        mock_store.update_payload.assert_not_called()
+        assert store.calls["update_payload"] == 0
 
 
 class TestBoostOnAccessBatch:
     """Tests for boost_on_access_batch method."""
 
     @pytest.mark.asyncio
-    async def test_batch_boost_empty_list(self, consolidator, mock_store):
+    async def test_batch_boost_empty_list(self, consolidator, store):
         """Test batch boost with empty list."""
         await consolidator.boost_on_access_batch([])
-        mock_store.get.assert_not_called()
+        assert store.calls["get"] == 0
 
     @pytest.mark.asyncio
-    async def test_batch_boost_multiple_memories(self, consolidator, mock_store):
+    async def test_batch_boost_multiple_memories(self, consolidator, store):
         """Test batch boost with multiple memories."""
         memories = [
             SearchResult(
@@ -225,8 +298,8 @@ class TestBoostOnAccessBatch:
                 },
             ),
         ]
-        mock_store.get.return_value = memories
-        mock_store.scroll.return_value = ([], None)
+        store.get_ret = memories
+        store.scroll_ret = ([], None)
 
         await consolidator.boost_on_access_batch([
             ("episodic", "mem1"),
@@ -234,4 +307,4 @@ class TestBoostOnAccessBatch:
         ])
 
         # Should call get for each collection
-        assert mock_store.get.call_count >= 1
+        assert store.calls["get"] >= 1
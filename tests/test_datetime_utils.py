@@ -3,64 +3,69 @@
 from datetime import UTC, datetime, timedelta
 
 import pytest
+from mcp_memoria.utils import datetime_utils
 from mcp_memoria.utils.datetime_utils import parse_datetime, parse_temporal_query
 
+FROZEN_NOW = datetime(2025, 1, 1, 12, 0, 0)
 
-class TestParseDatetime:
-    """Tests for parse_datetime function."""
 
-    def test_parse_none_returns_now(self) -> None:
-        """Test that None returns current datetime."""
-        before = datetime.now()
-        result = parse_datetime(None)
-        after = datetime.now()
-        assert before <= result <= after
+@pytest.fixture
+def frozen_now(monkeypatch: pytest.MonkeyPatch) -> datetime:
+    """Pin datetime.now() inside datetime_utils to FROZEN_NOW."""
 
-    def test_parse_datetime_object(self) -> None:
-        """Test that datetime objects are returned as-is."""
-        dt = datetime(2024, 1, 15, 10, 30, 0)
-        result = parse_datetime(dt)
-        assert result == dt
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return FROZEN_NOW if tz is None else FROZEN_NOW.replace(tzinfo=tz)
+
+    monkeypatch.setattr(datetime_utils, "datetime", FrozenDatetime)
+    return FROZEN_NOW
+
+
+class TestParseDatetime:
+    """Tests for parse_datetime function."""
 
-    def test_parse_iso_string(self) -> None:
-        """Test parsing ISO format string."""
-        iso_str = "2024-01-15T10:30:00"
-        result = parse_datetime(iso_str)
-        assert result == datetime(2024, 1, 15, 10, 30, 0)
-
-    def test_parse_iso_string_with_microseconds(self) -> None:
-        """Test parsing ISO format string with microseconds."""
-        iso_str = "2024-01-15T10:30:00.123456"
-        result = parse_datetime(iso_str)
-        assert result == datetime(2024, 1, 15, 10, 30, 0, 123456)
-
-    def test_parse_date_only_string(self) -> None:
-        """Test parsing date-only string."""
-        date_str = "2024-01-15"
-        result = parse_datetime(date_str)
-        assert result.year == 2024
-        assert result.month == 1
-        assert result.day == 15
-
-    def test_parse_datetime_with_space(self) -> None:
-        """Test parsing datetime with space separator."""
-        dt_str = "2024-01-15 10:30:00"
-        result = parse_datetime(dt_str)
-        assert result == datetime(2024, 1, 15, 10, 30, 0)
-
-    def test_parse_invalid_string_returns_now(self) -> None:
-        """Test that invalid strings return current datetime."""
-        before = datetime.now()
-        result = parse_datetime("not a date")
-        after = datetime.now()
-        assert before <= result <= after
-
-    def test_parse_unknown_type_returns_now(self) -> None:
-        """Test that unknown types return current datetime."""
-        before = datetime.now()
-        result = parse_datetime(12345)
-        after = datetime.now()
-        assert before <= result <= after
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            pytest.param(
+                datetime(2024, 1, 15, 10, 30, 0),
+                datetime(2024, 1, 15, 10, 30, 0),
+                id="datetime-object",
+            ),
+            pytest.param(
+                "2024-01-15T10:30:00", datetime(2024, 1, 15, 10, 30, 0), id="iso"
+            ),
+            pytest.param(
+                "2024-01-15T10:30:00.123456",
+                datetime(2024, 1, 15, 10, 30, 0, 123456),
+                id="iso-microseconds",
+            ),
+            pytest.param("2024-01-15", datetime(2024, 1, 15), id="date-only"),
+            pytest.param(
+                "2024-01-15 10:30:00", datetime(2024, 1, 15, 10, 30, 0), id="space"
+            ),
+            # fromisoformat rejects this one; the strptime fallback accepts it
+            pytest.param(
+                "2024-1-5 10:30:00", datetime(2024, 1, 5, 10, 30, 0), id="unpadded"
+            ),
+        ],
+    )
+    def test_parse(self, raw: object, expected: datetime) -> None:
+        """Test parsing of datetime objects and supported string formats."""
+        assert parse_datetime(raw) == expected
+
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            pytest.param(None, id="none"),
+            pytest.param("not a date", id="invalid-string"),
+            pytest.param(12345, id="unknown-type"),
+        ],
+    )
+    def test_parse_returns_now(self, raw: object, frozen_now: datetime) -> None:
+        """Test that missing or unparseable values return current datetime."""
+        assert parse_datetime(raw) == frozen_now
 
     def test_field_name_parameter(self) -> None:
         """Test that field_name parameter doesn't affect result."""
@@ -78,25 +78,15 @@ class TestWorkSession:
         assert session.category == SessionCategory.CODING
         assert session.status == SessionStatus.ACTIVE
 
-    def test_session_categories(self):
+    @pytest.mark.parametrize("cat", list(SessionCategory), ids=lambda c: c.name)
+    def test_session_categories(self, cat):
         """Test all session categories."""
-        categories = [
-            SessionCategory.CODING,
-            SessionCategory.REVIEW,
-            SessionCategory.MEETING,
-            SessionCategory.SUPPORT,
-            SessionCategory.RESEARCH,
-            SessionCategory.DOCUMENTATION,
-            SessionCategory.DEVOPS,
-            SessionCategory.OTHER,
-        ]
-        for cat in categories:
-            session = WorkSession(
-                id=uuid4(),
-                description="Test",
-                category=cat,
-            )
-            assert session.category == cat
+        session = WorkSession(
+            id=uuid4(),
+            description="Test",
+            category=cat,
+        )
+        assert session.category == cat
 
     def test_session_with_github_context(self):
         """Test session with GitHub issue/PR."""
@@ -153,44 +143,28 @@ class TestMemoryRelation:
         assert relation.relation_type == RelationType.CAUSES
         assert relation.weight == 1.0
 
-    def test_relation_types(self):
+    @pytest.mark.parametrize("rtype", list(RelationType), ids=lambda t: t.name)
+    def test_relation_types(self, rtype):
         """Test all relation types."""
-        types = [
-            RelationType.CAUSES,
-            RelationType.FIXES,
-            RelationType.SUPPORTS,
-            RelationType.OPPOSES,
-            RelationType.FOLLOWS,
-            RelationType.SUPERSEDES,
-            RelationType.DERIVES,
-            RelationType.PART_OF,
-            RelationType.RELATED,
-        ]
-        for rtype in types:
-            relation = MemoryRelation(
-                id=uuid4(),
-                source_id=uuid4(),
-                target_id=uuid4(),
-                relation_type=rtype,
-            )
-            assert relation.relation_type == rtype
-
-    def test_relation_creators(self):
+        relation = MemoryRelation(
+            id=uuid4(),
+            source_id=uuid4(),
+            target_id=uuid4(),
+            relation_type=rtype,
+        )
+        assert relation.relation_type == rtype
+
+    @pytest.mark.parametrize("creator", list(RelationCreator), ids=lambda c: c.name)
+    def test_relation_creators(self, creator):
         """Test relation creator types."""
-        creators = [
-            RelationCreator.USER,
-            RelationCreator.AUTO,
-            RelationCreator.SYSTEM,
-        ]
-        for creator in creators:
-            relation = MemoryRelation(
-                id=uuid4(),
-                source_id=uuid4(),
-                target_id=uuid4(),
-                relation_type=RelationType.RELATED,
-                created_by=creator,
-            )
-            assert relation.created_by == creator
+        relation = MemoryRelation(
+            id=uuid4(),
+            source_id=uuid4(),
+            target_id=uuid4(),
+            relation_type=RelationType.RELATED,
+            created_by=creator,
+        )
+        assert relation.created_by == creator
 
 
 class TestUserSetting:
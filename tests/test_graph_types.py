@@ -23,12 +23,11 @@ class TestRelationType:
 
     def test_all_relation_types(self):
         """Test all 9 relation types exist."""
-        expected = [
+        expected = {
             "causes", "fixes", "supports", "opposes",
             "follows", "supersedes", "derives", "part_of", "related"
-        ]
-        actual = [rt.value for rt in RelationType]
-        assert sorted(actual) == sorted(expected)
+        }
+        assert {rt.value for rt in RelationType} == expected
 
     def test_relation_type_values(self):
         """Test specific relation type values."""
@@ -265,23 +264,35 @@ class TestGraphPath:
         assert path.length == 0
 
 
+@pytest.fixture(scope="module")
+def sample_nodes() -> tuple[GraphNode, ...]:
+    """A center node and two neighbours at depth 1."""
+    return (
+        GraphNode(id="mem-center", label="Center", is_center=True),
+        GraphNode(id="mem-1", label="Node 1", depth=1),
+        GraphNode(id="mem-2", label="Node 2", depth=1),
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_edges() -> tuple[GraphEdge, ...]:
+    """Edges from the center node to each neighbour in sample_nodes."""
+    return (
+        GraphEdge(source="mem-center", target="mem-1", relation_type=RelationType.CAUSES),
+        GraphEdge(source="mem-center", target="mem-2", relation_type=RelationType.RELATED),
+    )
+
+
 class TestSubgraph:
     """Tests for Subgraph model."""
 
-    def test_create_subgraph(self):
+    def test_create_subgraph(self, sample_nodes, sample_edges):
         """Test creating a subgraph."""
         subgraph = Subgraph(
             center_id="mem-center",
             depth=2,
-            nodes=[
-                GraphNode(id="mem-center", label="Center", is_center=True),
-                GraphNode(id="mem-1", label="Node 1", depth=1),
-                GraphNode(id="mem-2", label="Node 2", depth=1),
-            ],
-            edges=[
-                GraphEdge(source="mem-center", target="mem-1", relation_type=RelationType.CAUSES),
-                GraphEdge(source="mem-center", target="mem-2", relation_type=RelationType.RELATED),
-            ],
+            nodes=list(sample_nodes),
+            edges=list(sample_edges),
         )
         assert subgraph.node_count == 3
         assert subgraph.edge_count == 2
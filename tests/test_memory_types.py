@@ -76,29 +76,56 @@ class TestMemoryItem:
         assert memory.access_count == original_count + 1
 
 
+@pytest.fixture(scope="module")
+def episodic_template() -> EpisodicMemory:
+    """Episodic memory built once; tests read it or take model_copy() variants."""
+    return EpisodicMemory(
+        content="Meeting notes",
+        session_id="session-123",
+        project="my-project",
+    )
+
+
+@pytest.fixture(scope="module")
+def semantic_template() -> SemanticMemory:
+    """Semantic memory built once; tests read it or take model_copy() variants."""
+    return SemanticMemory(
+        content="Python is a programming language",
+        domain="programming",
+        source="documentation",
+        confidence=0.95,
+    )
+
+
+@pytest.fixture(scope="module")
+def procedural_template() -> ProceduralMemory:
+    """Procedural memory built once; tests read it or take model_copy() variants."""
+    return ProceduralMemory(
+        content="Deploy procedure",
+        category="deployment",
+        steps=["git push", "run tests", "deploy"],
+    )
+
+
 class TestEpisodicMemory:
     """Tests for EpisodicMemory."""
 
-    def test_episodic_memory(self):
+    def test_episodic_memory(self, episodic_template):
         """Test episodic memory creation."""
-        memory = EpisodicMemory(
-            content="Meeting notes",
-            session_id="session-123",
-            project="my-project",
-        )
+        memory = episodic_template
 
         assert memory.memory_type == MemoryType.EPISODIC
         assert memory.session_id == "session-123"
         assert memory.project == "my-project"
 
-    def test_episodic_payload(self):
+    def test_episodic_payload(self, episodic_template):
         """Test episodic memory payload includes extra fields."""
-        memory = EpisodicMemory(
-            content="Test",
-            session_id="sess-1",
-            project="proj-1",
-            user_action="created file",
-        )
+        memory = episodic_template.model_copy(update={
+            "content": "Test",
+            "session_id": "sess-1",
+            "project": "proj-1",
+            "user_action": "created file",
+        })
         payload = memory.to_payload()
 
         assert payload["session_id"] == "sess-1"
@@ -109,53 +136,47 @@ class TestEpisodicMemory:
 class TestSemanticMemory:
     """Tests for SemanticMemory."""
 
-    def test_semantic_memory(self):
+    def test_semantic_memory(self, semantic_template):
         """Test semantic memory creation."""
-        memory = SemanticMemory(
-            content="Python is a programming language",
-            domain="programming",
-            source="documentation",
-            confidence=0.95,
-        )
+        memory = semantic_template
 
         assert memory.memory_type == MemoryType.SEMANTIC
         assert memory.domain == "programming"
         assert memory.confidence == 0.95
 
-    def test_semantic_payload(self):
+    def test_semantic_payload(self, semantic_template):
         """Test semantic memory payload."""
-        memory = SemanticMemory(
-            content="Fact",
-            domain="science",
-            confidence=0.9,
-        )
+        memory = semantic_template.model_copy(update={
+            "content": "Fact",
+            "domain": "science",
+            "source": None,
+            "confidence": 0.9,
+        })
         payload = memory.to_payload()
 
         assert payload["domain"] == "science"
         assert payload["confidence"] == 0.9
+        assert "source" not in payload
 
 
 class TestProceduralMemory:
     """Tests for ProceduralMemory."""
 
-    def test_procedural_memory(self):
+    def test_procedural_memory(self, procedural_template):
         """Test procedural memory creation."""
-        memory = ProceduralMemory(
-            content="Deploy procedure",
-            category="deployment",
-            steps=["git push", "run tests", "deploy"],
-        )
+        memory = procedural_template
 
         assert memory.memory_type == MemoryType.PROCEDURAL
         assert memory.category == "deployment"
         assert len(memory.steps) == 3
 
-    def test_record_execution(self):
+    def test_record_execution(self, procedural_template):
         """Test recording procedure execution."""
-        memory = ProceduralMemory(
-            content="Test procedure",
-            success_rate=1.0,
-        )
+        # A copy, so the shared template's counters stay untouched
+        memory = procedural_template.model_copy(update={
+            "content": "Test procedure",
+            "success_rate": 1.0,
+        })
 
         memory.record_execution(success=True)
         assert memory.execution_count == 1
@@ -164,6 +185,7 @@ class TestProceduralMemory:
         memory.record_execution(success=False)
         assert memory.execution_count == 2
         assert memory.success_rate < 1.0
+        assert procedural_template.execution_count == 0
 
 
 class TestCreateMemory:
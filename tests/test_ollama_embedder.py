@@ -11,19 +11,29 @@ from mcp_memoria.embeddings.ollama_client import (
 from mcp_memoria.core.rate_limiter import CircuitOpenError, RateLimitExceeded
 
 
-@pytest.fixture
+# Shared fake vectors; nothing in the embedder mutates them
+EMBEDDING = [0.1] * 768
+CACHED_EMBEDDING = [0.2] * 768
+
+
+def configure_client(client: MagicMock) -> None:
+    """Give a mock Ollama client its baseline responses."""
+    client.embeddings.return_value = {"embedding": EMBEDDING}
+    client.embed.side_effect = lambda model, input: {"embeddings": [EMBEDDING] * len(input)}
+    client.list.return_value = {"models": [{"name": "nomic-embed-text:latest"}]}
+
+
+@pytest.fixture(scope="module")
 def mock_ollama_client():
-    """Create a mock Ollama client."""
+    """Create a mock Ollama client shared by the module's tests."""
     client = MagicMock()
-    client.embeddings.return_value = {"embedding": [0.1] * 768}
-    client.list.return_value = {"models": [{"name": "nomic-embed-text:latest"}]}
-    client.pull = MagicMock()
+    configure_client(client)
     return client
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def embedder(mock_ollama_client):
-    """Create an embedder with mocked client."""
+    """Create an embedder with mocked client, shared by the module's tests."""
     with patch("mcp_memoria.embeddings.ollama_client.ollama.Client", return_value=mock_ollama_client):
         emb = OllamaEmbedder(
             host="http://localhost:11434",
@@ -34,6 +44,23 @@ def embedder(mock_ollama_client):
         return emb
 
 
+@pytest.fixture(scope="module")
+def cache_mock():
+    """Create a mock embedding cache shared by the module's tests."""
+    return AsyncMock()
+
+
+@pytest.fixture(autouse=True)
+def _reset_mocks(mock_ollama_client, embedder, cache_mock):
+    """Restore the shared mocks and embedder to their baseline before each test."""
+    mock_ollama_client.reset_mock(return_value=True, side_effect=True)
+    configure_client(mock_ollama_client)
+    cache_mock.reset_mock()
+    cache_mock.get.side_effect = None
+    cache_mock.get.return_value = None
+    embedder.cache = None
+
+
 class TestOllamaEmbedder:
     """Tests for OllamaEmbedder class."""
 
@@ -59,6 +86,10 @@ class TestOllamaEmbedder:
         result = embedder._apply_prefix("test document", text_type="document")
         assert result.startswith("search_document: ")
 
+    def test_apply_prefix_unknown_type(self, embedder):
+        """Test that unknown text types get no prefix."""
+        assert embedder._apply_prefix("text", text_type="other") == "text"
+
 
 class TestEmbed:
     """Tests for embed method."""
@@ -74,31 +105,27 @@ class TestEmbed:
         assert result.cached is False
 
     @pytest.mark.asyncio
-    async def test_embed_with_cache_hit(self, embedder, mock_ollama_client):
+    async def test_embed_with_cache_hit(self, embedder, mock_ollama_client, cache_mock):
         """Test embedding with cache hit."""
-        # Create mock cache
-        mock_cache = AsyncMock()
-        mock_cache.get.return_value = [0.2] * 768
-        embedder.cache = mock_cache
+        cache_mock.get.return_value = CACHED_EMBEDDING
+        embedder.cache = cache_mock
 
         result = await embedder.embed("test text", use_cache=True)
 
         assert result.cached is True
-        assert result.embedding == [0.2] * 768
+        assert result.embedding == CACHED_EMBEDDING
         mock_ollama_client.embeddings.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_embed_with_cache_miss(self, embedder, mock_ollama_client):
+    async def test_embed_with_cache_miss(self, embedder, mock_ollama_client, cache_mock):
         """Test embedding with cache miss."""
-        mock_cache = AsyncMock()
-        mock_cache.get.return_value = None
-        embedder.cache = mock_cache
+        embedder.cache = cache_mock
 
         result = await embedder.embed("test text", use_cache=True)
 
         assert result.cached is False
         mock_ollama_client.embeddings.assert_called_once()
-        mock_cache.set.assert_called_once()
+        cache_mock.set.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_embed_error_handling(self, embedder, mock_ollama_client):
@@ -113,15 +140,35 @@ class TestEmbedBatch:
     """Tests for embed_batch method."""
 
     @pytest.mark.asyncio
-    async def test_embed_batch_multiple(self, embedder):
-        """Test batch embedding of multiple texts."""
-        texts = ["text1", "text2", "text3"]
+    @pytest.mark.parametrize("count", [1, 3, 16])
+    async def test_embed_batch_multiple(self, embedder, mock_ollama_client, count):
+        """Test that a batch is embedded with one request, never text by text."""
+        texts = [f"text{i}" for i in range(count)]
         results = await embedder.embed_batch(texts)
 
-        assert len(results) == 3
+        assert len(results) == count
         for result in results:
             assert isinstance(result, EmbeddingResult)
             assert len(result.embedding) == 768
+        mock_ollama_client.embed.assert_called_once()
+        assert len(mock_ollama_client.embed.call_args.kwargs["input"]) == count
+        mock_ollama_client.embeddings.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_embed_batch_single_request(self, embedder, mock_ollama_client, cache_mock):
+        """Test that cache misses are embedded in one request."""
+        cache_mock.get.side_effect = lambda text, model: CACHED_EMBEDDING if "cached" in text else None
+        embedder.cache = cache_mock
+
+        results = await embedder.embed_batch(["cached text", "new1", "new2"])
+
+        mock_ollama_client.embed.assert_called_once()
+        assert mock_ollama_client.embed.call_args.kwargs["input"] == [
+            "search_document: new1",
+            "search_document: new2",
+        ]
+        assert [r.cached for r in results] == [True, False, False]
+        assert cache_mock.set.call_count == 2
 
 
 class TestConnection:
@@ -9,7 +9,8 @@ from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
-from mcp_memoria.db.models import SessionCategory, SessionStatus, WorkSession
+from mcp_memoria.db import QueryError
+from mcp_memoria.db.models import PauseEntry, SessionCategory, SessionStatus, WorkSession
 from mcp_memoria.work.work_tracker import WorkTracker
 
 
@@ -35,6 +36,11 @@ def make_session(
     )
 
 
+def with_names(sessions: list[WorkSession]) -> list[tuple]:
+    """Wrap sessions as get_all_active_with_names rows (no client/project)."""
+    return [(s, None, None) for s in sessions]
+
+
 def make_tracker(max_parallel: int = 3, warning_hours: float = 8.0) -> WorkTracker:
     """Create a WorkTracker with mocked dependencies."""
     db = MagicMock()
@@ -187,6 +193,59 @@ class TestStart:
         assert "error" not in result
         assert result["parallel_sessions"] == 2
 
+    @pytest.mark.asyncio
+    async def test_start_reuses_resolved_client_and_project(self):
+        tracker = make_tracker()
+        new_session = make_session("New task")
+        tracker._sessions.count_active.return_value = 0
+        tracker._sessions.create.return_value = new_session
+        tracker._sessions.get_all_active.return_value = [new_session]
+        client_id, project_id = uuid4(), uuid4()
+        tracker._clients.get_or_create_by_name.return_value = (client_id, True)
+        tracker._projects.get_or_create_by_name.return_value = (project_id, True)
+
+        await tracker.start("New task", client="Acme", project="Website")
+        await tracker.start("New task", client="Acme", project="Website")
+
+        tracker._clients.get_or_create_by_name.assert_awaited_once_with("Acme")
+        tracker._projects.get_or_create_by_name.assert_awaited_once_with(
+            "Website", client_id=client_id
+        )
+        assert tracker._sessions.create.await_args.kwargs["project_id"] == project_id
+
+    @pytest.mark.asyncio
+    async def test_start_retries_after_stale_cached_id(self):
+        tracker = make_tracker()
+        new_session = make_session("New task")
+        tracker._sessions.count_active.return_value = 0
+        tracker._sessions.get_all_active.return_value = [new_session]
+        stale_id, fresh_id = uuid4(), uuid4()
+        tracker._clients.get_or_create_by_name.side_effect = [
+            (stale_id, True),
+            (fresh_id, True),
+        ]
+        tracker._sessions.create.return_value = new_session
+        await tracker.start("New task", client="Acme")
+
+        # The client was deleted elsewhere, so its cached ID now fails the insert
+        tracker._sessions.create.side_effect = [QueryError("Fetchrow failed"), new_session]
+        result = await tracker.start("New task", client="Acme")
+
+        assert result["session_id"] == str(new_session.id)
+        assert tracker._clients.get_or_create_by_name.await_count == 2
+        assert tracker._sessions.create.await_args.kwargs["client_id"] == fresh_id
+
+    @pytest.mark.asyncio
+    async def test_start_does_not_retry_without_cached_ids(self):
+        tracker = make_tracker()
+        tracker._sessions.count_active.return_value = 0
+        tracker._clients.get_or_create_by_name.return_value = (uuid4(), True)
+        tracker._sessions.create.side_effect = QueryError("Fetchrow failed")
+
+        with pytest.raises(QueryError):
+            await tracker.start("New task", client="Acme")
+        assert tracker._sessions.create.await_count == 1
+
     @pytest.mark.asyncio
     async def test_start_blocked_at_max_limit(self):
         tracker = make_tracker(max_parallel=2)
@@ -292,6 +351,19 @@ class TestPauseResume:
         assert "error" not in result
         assert result["status"] == "paused"
 
+    @pytest.mark.asyncio
+    async def test_pause_reports_recorded_pause_start(self):
+        tracker = make_tracker()
+        session = make_session()
+        paused = make_session(status=SessionStatus.PAUSED)
+        pause_start = datetime.now(timezone.utc) - timedelta(seconds=5)
+        paused.pauses = [PauseEntry(start=pause_start)]
+        tracker._sessions.get_all_active.return_value = [session]
+        tracker._sessions.pause.return_value = paused
+
+        result = await tracker.pause()
+        assert result["paused_at"] == pause_start.isoformat()
+
     @pytest.mark.asyncio
     async def test_pause_multiple_active_requires_id(self):
         tracker = make_tracker()
@@ -359,7 +431,7 @@ class TestStatus:
     @pytest.mark.asyncio
     async def test_status_no_sessions(self):
         tracker = make_tracker()
-        tracker._sessions.get_all_active.return_value = []
+        tracker._sessions.get_all_active_with_names.return_value = with_names([])
 
         result = await tracker.status()
         assert result["active"] is False
@@ -370,7 +442,7 @@ class TestStatus:
         """Single session populates both sessions array and top-level fields."""
         tracker = make_tracker()
         session = make_session("Solo task")
-        tracker._sessions.get_all_active.return_value = [session]
+        tracker._sessions.get_all_active_with_names.return_value = with_names([session])
 
         result = await tracker.status()
         assert result["active"] is True
@@ -383,7 +455,7 @@ class TestStatus:
         """Multiple sessions should NOT have session_id at top level."""
         tracker = make_tracker()
         sessions = [make_session(f"Task {i}") for i in range(2)]
-        tracker._sessions.get_all_active.return_value = sessions
+        tracker._sessions.get_all_active_with_names.return_value = with_names(sessions)
 
         result = await tracker.status()
         assert result["active"] is True
@@ -394,7 +466,7 @@ class TestStatus:
     async def test_status_includes_warnings(self):
         tracker = make_tracker(warning_hours=2.0)
         old = make_session("Old task", hours_ago=5.0)
-        tracker._sessions.get_all_active.return_value = [old]
+        tracker._sessions.get_all_active_with_names.return_value = with_names([old])
 
         result = await tracker.status()
         assert "warnings" in result
@@ -405,7 +477,7 @@ class TestStatus:
         tracker = make_tracker()
         active = make_session("Active", status=SessionStatus.ACTIVE)
         paused = make_session("Paused", status=SessionStatus.PAUSED)
-        tracker._sessions.get_all_active.return_value = [active, paused]
+        tracker._sessions.get_all_active_with_names.return_value = with_names([active, paused])
 
         result = await tracker.status()
         assert result["active"] is True
@@ -528,3 +600,36 @@ class TestAddNote:
         result = await tracker.add_note("test note")
         assert "error" in result
         assert result.get("requires_session_id") is True
+
+
+# ── Report Tests ─────────────────────────────────────────────────
+
+
+class TestReport:
+    """Tests for report() name resolution."""
+
+    @pytest.mark.asyncio
+    async def test_report_resolves_names_without_per_session_lookups(self):
+        tracker = make_tracker()
+        client_id = uuid4()
+        client = MagicMock()
+        client.name = "Acme"
+        rows = [
+            (make_session(f"Task {i}", status=SessionStatus.COMPLETED,
+                          client_id=client_id), "Acme", "Website")
+            for i in range(3)
+        ]
+        tracker._sessions.aggregate.return_value = [(str(client_id), 180, 3)]
+        tracker._sessions.list_recent_with_names.return_value = rows
+        tracker._clients.get_many.return_value = {client_id: client}
+
+        result = await tracker.report(period="all", group_by="client")
+
+        tracker._clients.get_many.assert_awaited_once()
+        tracker._clients.get.assert_not_called()
+        tracker._projects.get.assert_not_called()
+        assert result["breakdown"][0]["group"] == "Acme"
+        assert result["total_sessions"] == 3
+        assert result["total_hours"] == 3.0
+        assert all(r["client"] == "Acme" for r in result["recent_sessions"])
+        assert all(r["project"] == "Website" for r in result["recent_sessions"])
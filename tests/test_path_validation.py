@@ -80,3 +80,52 @@ class TestValidateSafePath:
 
         result = validate_safe_path(Path("test.json"), allowed_dirs=[tmp_path])
         assert result == (tmp_path / "test.json").resolve()
+
+    def test_sibling_with_shared_prefix_blocked(self, tmp_path: Path) -> None:
+        """Test that a sibling whose name extends the allowed dir is blocked."""
+        allowed = tmp_path / "data"
+        allowed.mkdir()
+
+        with pytest.raises(PathTraversalError):
+            validate_safe_path(tmp_path / "data-other" / "x.json", allowed_dirs=[allowed])
+
+    def test_allowed_dir_itself(self, tmp_path: Path) -> None:
+        """Test that the allowed directory itself is accepted."""
+        assert validate_safe_path(tmp_path, allowed_dirs=[tmp_path]) == tmp_path.resolve()
+
+    def test_relative_allowed_dir_follows_cwd(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a relative allowed dir is resolved against the current cwd."""
+        first = tmp_path / "first"
+        second = tmp_path / "second"
+        (first / "data").mkdir(parents=True)
+        (second / "data").mkdir(parents=True)
+
+        monkeypatch.chdir(first)
+        validate_safe_path(first / "data" / "x.json", allowed_dirs=[Path("data")])
+
+        monkeypatch.chdir(second)
+        with pytest.raises(PathTraversalError):
+            validate_safe_path(first / "data" / "x.json", allowed_dirs=[Path("data")])
+        validate_safe_path(second / "data" / "x.json", allowed_dirs=[Path("data")])
+
+    def test_retargeted_symlink_allowed_dir(self, tmp_path: Path) -> None:
+        """Test that an allowed dir symlink is re-resolved after it moves."""
+        old_target = tmp_path / "old"
+        new_target = tmp_path / "new"
+        old_target.mkdir()
+        new_target.mkdir()
+        link = tmp_path / "link"
+
+        try:
+            link.symlink_to(old_target)
+        except (OSError, PermissionError):
+            pytest.skip("Cannot create symlinks")
+
+        validate_safe_path(old_target / "x.json", allowed_dirs=[link])
+
+        link.unlink()
+        link.symlink_to(new_target)
+        with pytest.raises(PathTraversalError):
+            validate_safe_path(old_target / "x.json", allowed_dirs=[link])
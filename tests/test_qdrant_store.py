@@ -0,0 +1,50 @@
+"""Tests for QdrantStore filter and payload handling."""
+
+import pytest
+
+from mcp_memoria.storage.qdrant_store import QdrantStore, _build_filter_cached
+
+
+@pytest.fixture
+async def store():
+    """In-memory store with one small collection."""
+    store = QdrantStore(vector_size=4)
+    store.create_collection("test")
+    yield store
+    await store.close()
+
+
+class TestFilterCache:
+    """Cached filters must not conflate equal-but-distinct values."""
+
+    @pytest.mark.asyncio
+    async def test_bool_and_int_conditions_are_distinct(self, store):
+        """Test that {"flag": 1} and {"flag": True} select different points."""
+        _build_filter_cached.cache_clear()
+        await store.upsert("test", [0.1, 0.2, 0.3, 0.4], {"flag": 1})
+        await store.upsert("test", [0.4, 0.3, 0.2, 0.1], {"flag": True})
+
+        as_int, _ = await store.scroll("test", filter_conditions={"flag": 1})
+        as_bool, _ = await store.scroll("test", filter_conditions={"flag": True})
+
+        assert [r.payload["flag"] for r in as_int] == [1]
+        assert [r.payload["flag"] for r in as_bool] == [True]
+        assert type(as_bool[0].payload["flag"]) is bool
+
+
+class TestUpdatePayloadBatch:
+    """Tests for grouped payload updates."""
+
+    @pytest.mark.asyncio
+    async def test_bool_and_int_payloads_not_grouped(self, store):
+        """Test that payloads differing only by True vs 1 are written separately."""
+        first = await store.upsert("test", [0.1, 0.2, 0.3, 0.4], {})
+        second = await store.upsert("test", [0.4, 0.3, 0.2, 0.1], {})
+
+        await store.update_payload_batch(
+            "test", [(first, {"flag": 1}), (second, {"flag": True})]
+        )
+
+        results = {r.id: r.payload["flag"] for r in await store.get("test", [first, second])}
+        assert type(results[first]) is int
+        assert type(results[second]) is bool
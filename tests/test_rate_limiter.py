@@ -43,6 +43,21 @@ class TestRateLimiter:
 
         assert exc_info.value.retry_after > 0
 
+    @pytest.mark.asyncio
+    async def test_retry_after_is_time_to_next_token(self) -> None:
+        """Test retry_after reflects the refill rate, not the whole window."""
+        config = RateLimitConfig(max_requests=3, window_seconds=60.0)
+        limiter = RateLimiter(config)
+
+        for _ in range(3):
+            await limiter.acquire()
+
+        with pytest.raises(RateLimitExceeded) as exc_info:
+            await limiter.acquire()
+
+        # One token refills every 60 / 3 = 20 seconds
+        assert exc_info.value.retry_after == pytest.approx(20.0, abs=0.1)
+
     @pytest.mark.asyncio
     async def test_try_acquire(self) -> None:
         """Test try_acquire returns boolean."""
@@ -0,0 +1,46 @@
+"""Tests for SearchMemoryTool date parsing."""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pydantic import ValidationError
+
+from mcp_memoria.tools.search_tool import SearchMemoryTool
+
+
+def make_tool() -> SearchMemoryTool:
+    """Create a SearchMemoryTool over a mocked MemoryManager."""
+    manager = MagicMock()
+    manager.search = AsyncMock(return_value=[])
+    return SearchMemoryTool(manager)
+
+
+class TestDateParsing:
+    @pytest.mark.asyncio
+    async def test_iso_datetime_string(self):
+        tool = make_tool()
+        await tool.execute(date_from="2024-01-15T10:30:00", date_to=None)
+        kwargs = tool.memory_manager.search.await_args.kwargs
+        assert kwargs["date_from"] == datetime(2024, 1, 15, 10, 30)
+        assert kwargs["date_to"] is None
+
+    @pytest.mark.asyncio
+    async def test_compact_iso_date_is_not_a_timestamp(self):
+        tool = make_tool()
+        await tool.execute(date_from="20240115")
+        assert tool.memory_manager.search.await_args.kwargs["date_from"] == datetime(2024, 1, 15)
+
+    @pytest.mark.asyncio
+    async def test_epoch_string_rejected(self):
+        tool = make_tool()
+        with pytest.raises(ValidationError):
+            await tool.execute(date_from="1700000000")
+        tool.memory_manager.search.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_datetime_passes_through(self):
+        tool = make_tool()
+        value = datetime(2024, 1, 15, 8, 0)
+        await tool.execute(date_to=value)
+        assert tool.memory_manager.search.await_args.kwargs["date_to"] is value
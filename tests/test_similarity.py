@@ -0,0 +1,48 @@
+"""Tests for vector similarity helpers."""
+
+import numpy as np
+import pytest
+
+from mcp_memoria.utils.similarity import cosine_topk, normalize_rows
+
+
+class TestNormalizeRows:
+    """Tests for normalize_rows."""
+
+    def test_rows_have_unit_length(self):
+        """Test that each row is scaled to unit length."""
+        result = normalize_rows(np.array([[3.0, 4.0], [0.0, 2.0]]))
+        np.testing.assert_allclose(np.linalg.norm(result, axis=1), [1.0, 1.0])
+
+    def test_zero_row_stays_zero(self):
+        """Test that zero vectors don't produce NaNs."""
+        result = normalize_rows(np.zeros((1, 3)))
+        assert not np.isnan(result).any()
+
+
+class TestCosineTopk:
+    """Tests for cosine_topk."""
+
+    def test_single_query(self):
+        """Test ordering and scores for a 1-D query."""
+        candidates = np.array([[0.0, 1.0], [1.0, 0.0], [1.0, 1.0]])
+        indices, scores = cosine_topk(np.array([1.0, 0.0]), candidates, k=2)
+
+        assert indices.tolist() == [1, 2]
+        assert scores[0] == pytest.approx(1.0)
+        assert scores[1] == pytest.approx(np.sqrt(0.5))
+
+    def test_batched_queries(self):
+        """Test that each query row gets its own neighbors."""
+        candidates = np.array([[0.0, 1.0], [1.0, 0.0]])
+        indices, scores = cosine_topk(np.array([[1.0, 0.0], [0.0, 2.0]]), candidates, k=1)
+
+        assert indices.shape == (2, 1)
+        assert indices[:, 0].tolist() == [1, 0]
+        np.testing.assert_allclose(scores[:, 0], [1.0, 1.0])
+
+    def test_k_larger_than_candidates(self):
+        """Test that k is capped at the number of candidates."""
+        indices, scores = cosine_topk(np.array([1.0, 0.0]), np.array([[1.0, 0.0]]), k=5)
+        assert indices.tolist() == [0]
+        assert len(scores) == 1